@@ -3,18 +3,19 @@ CLI tool to create Bible study notes in an Obsidian vault.
 ----------------------------------------------------------
 """
 
-import textwrap
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich import print
+from rich import get_console
 from typing_extensions import Annotated
 
 import journal
 from config import InvalidVaultError, load_config
-from utils import daily_exists, format_hashtags
+from utils import append_to_note, daily_exists, format_hashtags, write_note
+
+print = get_console().print
 
 app = typer.Typer(
     name="bible",
@@ -23,7 +24,7 @@ app = typer.Typer(
 )
 
 
-KJV_BIBLE_BOOKS = [
+KJV_BIBLE_BOOKS: tuple[tuple[str, int], ...] = (
     # Old Testament
     ("Genesis", 50),
     ("Exodus", 40),
@@ -92,105 +93,176 @@ KJV_BIBLE_BOOKS = [
     ("3 John", 1),
     ("Jude", 1),
     ("Revelation", 22),
-]
+)
+
+
+CHAPTER_TEMPLATE = """\
+# {book} | Chapter {chapter}
+
+**Date Read**: {date_read}
+
+## Key Verses
+
+>
+
+## Main Themes
+
+-
+-
+-
+
+## Personal Insights
+
+---
+
+**Tags**: #bible #{book_name} #chapter{chapter} {tags}
+**Next**: {next}
+**Previous**: {previous}
+
+---
+
+{links}"""
+
+
+# Precomputed lookups built once at import time
+_BOOK_INDEX = {b.lower(): (i, chapters) for i, (b, chapters) in enumerate(KJV_BIBLE_BOOKS)}
+
+
+def _book_set(start: int, stop: Optional[int] = None) -> frozenset[str]:
+    """Build a lowercase set of book names from a slice of KJV_BIBLE_BOOKS."""
+    return frozenset(b.lower() for b, _ in KJV_BIBLE_BOOKS[start:stop])
+
+
+_OLD_TESTAMENT = _book_set(0, 39)
+_PENTATEUCH = _book_set(0, 5)
+_POETRY = _book_set(17, 22)
+_MAJOR_PROPHETS = _book_set(22, 27)
+_MINOR_PROPHETS = _book_set(27, 39)
+_NEW_TESTAMENT = _book_set(39)
+_SYNOPTIC_GOSPELS = _book_set(39, 42)
+_PAULINE_LETTERS = _book_set(44, 57)
+_PRISON_LETTERS = _book_set(48, 51) | {"philemon"}
+_PASTORAL_LETTERS = _book_set(53, 56)
+_GENERAL_LETTERS = _book_set(58, 65)
+
+# Composite categories, with their special cases folded in
+_GOSPELS = _SYNOPTIC_GOSPELS | {"john"}
+_HISTORY = _book_set(5, 17) | _GOSPELS | {"acts"}
+_PROPHETIC = _MAJOR_PROPHETS | _MINOR_PROPHETS | {"revelation"}
+_LETTERS = _PAULINE_LETTERS | _GENERAL_LETTERS | {"hebrews"}
+
+# Category note links in the order they appear in a chapter note, one bit each
+_CATEGORY_LINKS = tuple(
+    (1 << bit, books, link)
+    for bit, (books, link) in enumerate(
+        (
+            (_OLD_TESTAMENT, "[[old_testament]]"),
+            (_PENTATEUCH, "[[pentateuch]]"),
+            (_HISTORY, "[[historical_books]]"),
+            (_POETRY, "[[poetic_books]]"),
+            (_MAJOR_PROPHETS, "[[major_prophets]]"),
+            (_MINOR_PROPHETS, "[[minor_prophets]]"),
+            (_PROPHETIC, "[[prophetic_books]]"),
+            (_NEW_TESTAMENT, "[[new_testament]]"),
+            (_SYNOPTIC_GOSPELS, "[[synoptic_gospels]]"),
+            (_GOSPELS, "[[gospels]]"),
+            (_PAULINE_LETTERS, "[[pauline_letters]]"),
+            (_PRISON_LETTERS, "[[prison_letters]]"),
+            (_PASTORAL_LETTERS, "[[pastoral_letters]]"),
+            (_GENERAL_LETTERS, "[[general_letters]]"),
+            (_LETTERS, "[[letters]]"),
+        )
+    )
+)
+
+# Bitmask of the categories each book belongs to
+_CATEGORY_BITS = {key: sum(bit for bit, books, _ in _CATEGORY_LINKS if key in books) for key in _BOOK_INDEX}
 
 
 def _is_valid_chapter(book: str, chapter: int) -> bool:
     """Check if a chapter is valid for a given book."""
-    return 1 <= chapter <= dict(KJV_BIBLE_BOOKS).get(book, 0)
+    book_entry = _BOOK_INDEX.get(book.lower())
+    return book_entry is not None and 1 <= chapter <= book_entry[1]
 
 
 def _is_valid_book(book: str) -> bool:
     """Check if a book is valid."""
-    all_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS}
-    return book.lower() in all_books
+    return book.lower() in _BOOK_INDEX
 
 
 def _is_old_testament(book: str) -> bool:
     """Check if a book is in the Old Testament."""
-    old_testament_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[:39]}
-    return book.lower() in old_testament_books
+    return book.lower() in _OLD_TESTAMENT
 
 
 def _is_pentateuch(book: str) -> bool:
     """Check if a book is in the Pentateuch."""
-    pentateuch_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[:5]}
-    return book.lower() in pentateuch_books
+    return book.lower() in _PENTATEUCH
 
 
 def _is_history(book: str) -> bool:
     """Check if a book is in the Historical books of the Old Testament."""
-    history_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[5:17]}
-    return book.lower() in history_books or _is_gospel(book) or book.lower() == "acts"
+    return book.lower() in _HISTORY
 
 
 def _is_poetry(book: str) -> bool:
     """Check if a book is in the Poetic books of the Old Testament."""
-    poetry_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[17:22]}
-    return book.lower() in poetry_books
+    return book.lower() in _POETRY
 
 
 def _is_major_prophets(book: str) -> bool:
     """Check if a book is in the Major Prophets of the Old Testament."""
-    major_prophets_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[22:27]}
-    return book.lower() in major_prophets_books
+    return book.lower() in _MAJOR_PROPHETS
 
 
 def _is_minor_prophets(book: str) -> bool:
     """Check if a book is in the Minor Prophets of the Old Testament."""
-    minor_prophets_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[27:39]}
-    return book.lower() in minor_prophets_books
+    return book.lower() in _MINOR_PROPHETS
 
 
 def _is_prophetic(book: str) -> bool:
     """Check if a book is in the Prophetic books of the Old Testament."""
-    return _is_major_prophets(book) or _is_minor_prophets(book) or book.lower() == "revelation"
+    return book.lower() in _PROPHETIC
 
 
 def _is_new_testament(book: str) -> bool:
     """Check if a book is in the New Testament."""
-    new_testament_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[39:]}
-    return book.lower() in new_testament_books
+    return book.lower() in _NEW_TESTAMENT
 
 
 def _is_synoptic_gospels(book: str) -> bool:
     """Check if a book is in the Synoptic Gospels of the New Testament."""
-    synoptic_gospels_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[39:42]}
-    return book.lower() in synoptic_gospels_books
+    return book.lower() in _SYNOPTIC_GOSPELS
 
 
 def _is_gospel(book: str) -> bool:
     """Check if a book is in the Gospels of the New Testament."""
-    return _is_synoptic_gospels(book) or book.lower() == "john"
+    return book.lower() in _GOSPELS
 
 
 def _is_pauline_letters(book: str) -> bool:
     """Check if a book is in the Pauline Letters of the New Testament."""
-    pauline_letters_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[44:57]}
-    return book.lower() in pauline_letters_books
+    return book.lower() in _PAULINE_LETTERS
 
 
 def _is_prison_letters(book: str) -> bool:
     """Check if a book is in the Prison Letters of the New Testament."""
-    prison_letters_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[48:51]}
-    return book.lower() in prison_letters_books or book.lower() == "philemon"
+    return book.lower() in _PRISON_LETTERS
 
 
 def _is_pastoral_letters(book: str) -> bool:
     """Check if a book is in the Pastoral Letters of the New Testament."""
-    pastoral_letters_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[53:56]}
-    return book.lower() in pastoral_letters_books
+    return book.lower() in _PASTORAL_LETTERS
 
 
 def _is_general_letters(book: str) -> bool:
     """Check if a book is in the General Letters of the New Testament."""
-    general_letters_books = {b.lower() for b, _ in KJV_BIBLE_BOOKS[58:65]}
-    return book.lower() in general_letters_books
+    return book.lower() in _GENERAL_LETTERS
 
 
 def _is_letters(book: str) -> bool:
     """Check if a book is in the Letters of the New Testament."""
-    return _is_pauline_letters(book) or _is_general_letters(book) or book.lower() == "hebrews"
+    return book.lower() in _LETTERS
 
 
 def _get_links(book: str, chapter: int) -> tuple[str, str, list[str]]:
@@ -207,37 +279,8 @@ def _get_links(book: str, chapter: int) -> tuple[str, str, list[str]]:
     prev_link = f"[[{previous_chapter}]]" if previous_chapter else "N/A"
     next_link = f"[[{next_chapter}]]" if next_chapter else "N/A"
 
-    misc_links = ["the_bible"]
-    if _is_old_testament(book):
-        misc_links.append("old_testament")
-    if _is_pentateuch(book):
-        misc_links.append("pentateuch")
-    if _is_history(book):
-        misc_links.append("historical_books")
-    if _is_poetry(book):
-        misc_links.append("poetic_books")
-    if _is_major_prophets(book):
-        misc_links.append("major_prophets")
-    if _is_minor_prophets(book):
-        misc_links.append("minor_prophets")
-    if _is_prophetic(book):
-        misc_links.append("prophetic_books")
-    if _is_new_testament(book):
-        misc_links.append("new_testament")
-    if _is_synoptic_gospels(book):
-        misc_links.append("synoptic_gospels")
-    if _is_gospel(book):
-        misc_links.append("gospels")
-    if _is_pauline_letters(book):
-        misc_links.append("pauline_letters")
-    if _is_prison_letters(book):
-        misc_links.append("prison_letters")
-    if _is_pastoral_letters(book):
-        misc_links.append("pastoral_letters")
-    if _is_general_letters(book):
-        misc_links.append("general_letters")
-    if _is_letters(book):
-        misc_links.append("letters")
+    bits = _CATEGORY_BITS.get(book.lower(), 0)
+    misc_links = ["[[the_bible]]"] + [link for bit, _, link in _CATEGORY_LINKS if bits & bit]
 
     return prev_link, next_link, misc_links
 
@@ -254,6 +297,12 @@ def _format_book_name(book: str) -> str:
     return book.replace(" ", "_").lower()
 
 
+# Note name prefixes and book-boundary chapter names, indexed like KJV_BIBLE_BOOKS
+_BOOK_NAMES = tuple(_format_book_name(b) for b, _ in KJV_BIBLE_BOOKS)
+_FIRST_CHAPTERS = tuple(f"{name}_1" for name in _BOOK_NAMES)
+_LAST_CHAPTERS = tuple(f"{name}_{chapters}" for name, (_, chapters) in zip(_BOOK_NAMES, KJV_BIBLE_BOOKS, strict=True))
+
+
 def _get_adjacent_chapters(book: str, chapter: int) -> tuple[Optional[str], Optional[str]]:
     """Get the previous and next chapters for a given book and chapter.
 
@@ -264,33 +313,26 @@ def _get_adjacent_chapters(book: str, chapter: int) -> tuple[Optional[str], Opti
     Returns:
         tuple[Optional[str], Optional[str]]: A tuple containing the previous and next chapter references.
     """
-    book_index = -1
-    current_book_chapters = 0
-
-    for i, (b, chapters) in enumerate(KJV_BIBLE_BOOKS):
-        if b.lower() == book.lower():
-            book_index = i
-            current_book_chapters = chapters
-            break
-
-    if book_index < 0:
+    book_entry = _BOOK_INDEX.get(book.lower())
+    if book_entry is None:
         return None, None
+
+    book_index, current_book_chapters = book_entry
     if chapter < 1 or chapter > current_book_chapters:
         return None, None
 
+    book_name = _BOOK_NAMES[book_index]
     previous_chapter = None
     next_chapter = None
     if chapter > 1:
-        previous_chapter = f"{_format_book_name(book)}_{chapter - 1}"
+        previous_chapter = f"{book_name}_{chapter - 1}"
     elif book_index > 0:
-        prev_book, prev_chapters = KJV_BIBLE_BOOKS[book_index - 1]
-        previous_chapter = f"{_format_book_name(prev_book)}_{prev_chapters}"
+        previous_chapter = _LAST_CHAPTERS[book_index - 1]
 
     if chapter < current_book_chapters:
-        next_chapter = f"{_format_book_name(book)}_{chapter + 1}"
+        next_chapter = f"{book_name}_{chapter + 1}"
     elif book_index < len(KJV_BIBLE_BOOKS) - 1:
-        next_book, _ = KJV_BIBLE_BOOKS[book_index + 1]
-        next_chapter = f"{_format_book_name(next_book)}_1"
+        next_chapter = _FIRST_CHAPTERS[book_index + 1]
 
     return previous_chapter, next_chapter
 
@@ -326,63 +368,45 @@ def chapter(
         print(f":cross_mark: [bold red]Chapter {chapter} is not valid for the book of {book}.[/bold red]")
         raise typer.Exit(code=1)
 
-    bible_path = config.vault_path / "1_Projects/Bible-Study" / book.title()
-    bible_path.mkdir(parents=True, exist_ok=True)
-
     date_read = date_read or datetime.now().strftime("%Y-%m-%d")
 
-    note_filename = f"{_format_book_name(book)}_{chapter:02}.md"
-    note_path = bible_path / note_filename
+    book_name = _format_book_name(book)
+    note_filename = f"{book_name}_{chapter:02}.md"
+    relative_path = f"1_Projects/Bible-Study/{book.title()}/{note_filename}"
+    note_path = config.vault_path / relative_path
 
     if note_path.exists():
         print(f":information: [yellow]Chapter summary for {book} chapter {chapter} already exists.[/yellow]")
         raise typer.Exit(code=0)
 
-    daily_path = config.vault_path / "2_Areas/Journal/Daily" / f"{date_read}.md"
+    daily_path = config.vault_path / f"2_Areas/Journal/Daily/{date_read}.md"
     if not daily_exists(daily_path):
         ctx.invoke(journal.daily)
         print(f":spiral_notepad: [yellow]Created daily note for {date_read}.[/yellow]")
 
     prev, nxt, misc_links = _get_links(book, chapter)
 
-    content = textwrap.dedent(f"""\
-            # {book} | Chapter {chapter}
-
-            **Date Read**: {date_read}
-
-            ## Key Verses
-
-            >
-
-            ## Main Themes
-
-            -
-            -
-            -
-
-            ## Personal Insights
-
-            ---
-
-            **Tags**: #bible #{_format_book_name(book)} #chapter{chapter} {format_hashtags(tags)}
-            **Next**: {nxt}
-            **Previous**: {prev}
-
-            ---
-
-            {" ".join(f"[[{link}]]" for link in misc_links)}""")
+    content = CHAPTER_TEMPLATE.format_map(
+        {
+            "book": book,
+            "chapter": chapter,
+            "date_read": date_read,
+            "book_name": book_name,
+            "tags": format_hashtags(tags),
+            "next": nxt,
+            "previous": prev,
+            "links": " ".join(misc_links),
+        }
+    )
 
     try:
-        with note_path.open("w", encoding="utf-8") as f:
-            f.write(content)
-        with daily_path.open("a", encoding="utf-8") as f:
-            f.write(f"[[{note_filename}]]")
+        write_note(note_path, content)
+        append_to_note(daily_path, f"[[{note_filename}]]")
 
     except Exception as exc:
         print(f":cross_mark: [bold red]Failed to create chapter summary: {exc}[/bold red]")
         raise typer.Exit(code=1) from exc
 
-    relative_path = note_path.relative_to(config.vault_path)
     print(f":white_check_mark: [green]Bible chapter summary created:[/green] {relative_path}")
 
 
@@ -11,18 +11,31 @@ Functions:
 
 """
 
+import os
+import stat
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Optional, Union
 
-from pydantic import BaseModel
-from pydantic_yaml import parse_yaml_file_as
+import yaml
 
 from utils import find_vault_root
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 # Default Configuration
 VAULT_NAME = "second-brain"
 INBOX_FOLDER = "0_Inbox"
 
+# Vault validation error messages
+_ERR_NO_VAULT = "No second-brain vault found."
+_ERR_INVALID = "Invalid vault path: {}"
+_ERR_NOT_OBSIDIAN = "{} is not a valid Obsidian vault."
+
 
 class InvalidVaultError(Exception):
     """Custom exception for invalid vault paths."""
@@ -30,31 +43,63 @@ class InvalidVaultError(Exception):
     pass
 
 
-class Config(BaseModel):
+@dataclass(slots=True)
+class Config:
     """Configuration model for the second-brain CLI."""
 
     vault_path: Optional[Path] = None
     inbox_folder: str = INBOX_FOLDER
 
     @staticmethod
-    def load(filename: Union[str, Path]) -> Optional["Config"]:
+    def load(source: Union[str, Path, IO[bytes], IO[str]]) -> Optional["Config"]:
         """Load configuration from a YAML file.
 
         Args:
-            filename (Union[str, Path]): Path to the configuration file.
+            source (Union[str, Path, IO[bytes], IO[str]]): Path to the configuration file, or an
+                already open file object to read it from.
 
         Returns:
             Optional[Config]: Loaded configuration object or None if config file not found.
-        """
-        if not Path(filename).exists():
-            print(f":warning: [yellow]Config file {filename} not found. Using defaults.[/yellow]")
-            return None
-        return parse_yaml_file_as(Config, filename)
-
 
+        Raises:
+            yaml.YAMLError: If the file is not valid YAML.
+            ValueError: If the file does not contain a mapping of settings, or a setting is not a string.
+        """
+        raw: Union[bytes, str]
+        if isinstance(source, (str, os.PathLike)):
+            try:
+                with open(source, "rb") as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                print(f":warning: [yellow]Config file {source} not found. Using defaults.[/yellow]")
+                return None
+        else:
+            raw = source.read()
+
+        data = yaml.load(raw, Loader=SafeLoader) or {}
+        if not isinstance(data, dict):
+            raise ValueError(f"Config file {source} must contain a mapping of settings.")
+
+        vault_path = data.get("vault_path")
+        inbox_folder = data.get("inbox_folder")
+        for key, value in (("vault_path", vault_path), ("inbox_folder", inbox_folder)):
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"{key} in config file {source} must be a string.")
+
+        return Config(
+            vault_path=Path(vault_path) if vault_path is not None else None,
+            inbox_folder=inbox_folder or INBOX_FOLDER,
+        )
+
+
+@lru_cache(maxsize=4)
 def load_config(config_file: Path, vault_path: Optional[Path]) -> Config:
     """Load configuration from file and override with command-line options.
 
+    Results are cached per (config_file, vault_path) so that commands invoking
+    other commands within the same process (e.g. creating the daily note) do not
+    parse and validate the config again.
+
     Args:
         config_file (Path): Path to the configuration file.
         vault_path (Optional[Path]): Command-line specified vault path.
@@ -65,21 +110,25 @@ def load_config(config_file: Path, vault_path: Optional[Path]) -> Config:
     Raises:
         InvalidVaultError: If the specified vault path is invalid.
     """
-    config = Config.load(config_file.expanduser()) or Config()
-    if not config.vault_path:
-        config.vault_path = find_vault_root(VAULT_NAME)
+    config = Config.load(os.path.expanduser(config_file)) or Config()
     if vault_path:
         config.vault_path = vault_path
+    elif not config.vault_path:
+        config.vault_path = find_vault_root(VAULT_NAME)
 
     if not config.vault_path:
-        raise InvalidVaultError("No second-brain vault found.")
+        raise InvalidVaultError(_ERR_NO_VAULT)
 
     config.vault_path = config.vault_path.expanduser()
 
-    if not config.vault_path.exists() or not config.vault_path.is_dir():
-        raise InvalidVaultError(f"Invalid vault path: {config.vault_path}")
+    try:
+        is_dir = stat.S_ISDIR(config.vault_path.stat().st_mode)
+    except OSError:
+        is_dir = False
+    if not is_dir:
+        raise InvalidVaultError(_ERR_INVALID.format(config.vault_path))
 
     if not (config.vault_path / ".obsidian").exists():
-        raise InvalidVaultError(f"{config.vault_path} is not a valid Obsidian vault.")
+        raise InvalidVaultError(_ERR_NOT_OBSIDIAN.format(config.vault_path))
 
     return config
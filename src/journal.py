@@ -3,17 +3,19 @@ CLI tool to create daily journal entries in an Obsidian vault.
 --------------------------------------------------------------
 """
 
-import textwrap
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich import print
+from rich import get_console
 from typing_extensions import Annotated
 
 from config import InvalidVaultError, load_config
-from utils import format_hashtags
+from utils import format_hashtags, write_note
+
+print = get_console().print
 
 app = typer.Typer(
     name="journal",
@@ -22,263 +24,185 @@ app = typer.Typer(
 )
 
 
-@app.command(name="monthly")
-def monthly(
-    vault_path: Annotated[Optional[Path], typer.Option("--path", "-p", help="Path to the Obsidian vault.")] = None,
-    config_file: Annotated[
-        str, typer.Option("--config", "-c", help="Path to the sb config file.")
-    ] = "~/.sb_config.yml",
-    tags: Annotated[
-        Optional[str], typer.Option("--tags", "-t", help="Comma-separated tags to include in the note.")
-    ] = None,
-) -> None:
-    """Create a new monthly reflection entry."""
-    try:
-        config = load_config(Path(config_file), vault_path)
-    except InvalidVaultError as exc:
-        print(f":cross_mark: [bold red]{exc}[/bold red]")
-        raise typer.Exit(code=1) from exc
-
-    monthly_path = config.vault_path / "2_Areas/Journal/Monthly-Reflection"
-    monthly_path.mkdir(parents=True, exist_ok=True)
-
-    this_month = datetime.now().strftime("%b-%Y")
-    note_path = monthly_path / f"{this_month}.md"
-
-    if note_path.exists():
-        print(f":information: [yellow]Monthly reflection for {this_month} already exists.[/yellow]")
-        raise typer.Exit(code=0)
-
-    created_date = datetime.now().strftime("%Y-%m-%d")
+MONTHLY_TEMPLATE = """\
+# {title} Monthly Reflection
 
-    content = textwrap.dedent(f"""\
-            # {this_month.replace("-", " - ")} Monthly Reflection
+**Review Date**: {date}
+**Overall Month Rating**: /10
 
-            **Review Date**: {created_date}
-            **Overall Month Rating**: /10
+## Month at a Glance
 
-            ## Month at a Glance
-
-            **Theme for the Month**:
-            **Major Events**:
-            -
-            -
-            -
-
-            ## Projects Review
-
-            ### Completed Projects:
-
-            - ✅ Project 1 - *Impact/Outcome*
-            - ✅ Project 2 - *Impact/Outcome*
-
-            ### Ongoing Projects Progress:
-
-            | Project | Started | Progress | Blockers | Target Completion |
-            |---------|---------|----------|----------|-------------------|
-            |         |         | %        |          |                   |
-
-            ### Projects to Archive/Pause:
-
-            - [ ] Project → Reason for archiving
-            - [ ] Project → Reason for pausing
-
-            ## Areas Deep Dive
-
-            ### Health & Wellness
-
-            **Rating**: /10
-            **Highlights**:
-            **Improvements needed**:
-            **Next month focus**:
+**Theme for the Month**:
+**Major Events**:
+-
+-
+-
 
-            ### Work/Career
+## Projects Review
 
-            **Rating**: /10
-            **Major accomplishments**:
-            **Challenges faced**:
-            **Skills developed**:
-            **Next month focus**:
+### Completed Projects:
 
-            ### Relationships
+- ✅ Project 1 - *Impact/Outcome*
+- ✅ Project 2 - *Impact/Outcome*
 
-            **Rating**: /10
-            **Quality time with**:
-            **Relationships that need attention**:
-            **Next month focus**:
+### Ongoing Projects Progress:
 
-            ### Learning & Growth
+| Project | Started | Progress | Blockers | Target Completion |
+|---------|---------|----------|----------|-------------------|
+|         |         | %        |          |                   |
 
-            **Rating**: /10
-            **New skills/knowledge**:
-            **Books completed**:
-            **Courses/Training**:
-            **Next month focus**:
+### Projects to Archive/Pause:
 
-            ### Finances
+- [ ] Project → Reason for archiving
+- [ ] Project → Reason for pausing
 
-            **Rating**: /10
-            **Financial goals progress**:
-            **Major expenses**:
-            **Areas for improvement**:
-            **Next month focus**:
+## Areas Deep Dive
 
-            ### Personal/Spiritual
+### Health & Wellness
 
-            **Rating**: /10
-            **Spiritual practices**:
-            **Personal development**:
-            **Values alignment**:
-            **Next month focus**:
+**Rating**: /10
+**Highlights**:
+**Improvements needed**:
+**Next month focus**:
 
-            ## Knowledge System Review
+### Work/Career
 
-            ### Notes Created:
+**Rating**: /10
+**Major accomplishments**:
+**Challenges faced**:
+**Skills developed**:
+**Next month focus**:
 
-            ### Most Valuable Notes:
+### Relationships
 
-            -
-            -
-            -
+**Rating**: /10
+**Quality time with**:
+**Relationships that need attention**:
+**Next month focus**:
 
-            ### System Improvements:
+### Learning & Growth
 
-            **What's working well**:
+**Rating**: /10
+**New skills/knowledge**:
+**Books completed**:
+**Courses/Training**:
+**Next month focus**:
 
-            **What needs adjustment**:
+### Finances
 
-            **Changes to implement**:
+**Rating**: /10
+**Financial goals progress**:
+**Major expenses**:
+**Areas for improvement**:
+**Next month focus**:
 
-            ## Celebrations & Gratitude
+### Personal/Spiritual
 
-            ### Proud moments:
+**Rating**: /10
+**Spiritual practices**:
+**Personal development**:
+**Values alignment**:
+**Next month focus**:
 
-            1.
-            2.
-            3.
+## Knowledge System Review
 
-            ### Grateful for:
+### Notes Created:
 
-            -
-            -
-            -
+### Most Valuable Notes:
 
-            ## Lessons & Insights
+-
+-
+-
 
-            ### Key learnings this month:
+### System Improvements:
 
-            ### Patterns I noticed:
+**What's working well**:
 
-            ### Habits that served me well:
+**What needs adjustment**:
 
-            ### Habits to change:
+**Changes to implement**:
 
-            ## Next Month Planning
+## Celebrations & Gratitude
 
-            ### Theme/Focus for Next Month:
+### Proud moments:
 
-            ### Top 3 Goals:
+1.
+2.
+3.
 
-            1.
-            2.
-            3.
+### Grateful for:
 
-            ### Areas requiring attention:
+-
+-
+-
 
-            -
-            -
+## Lessons & Insights
 
-            ### Experiments to try:
+### Key learnings this month:
 
-            -
-            -
+### Patterns I noticed:
 
-            ### Important dates/events:
+### Habits that served me well:
 
-            -
-            -
+### Habits to change:
 
-            ## Metrics & Tracking
+## Next Month Planning
 
-            <!-- Add any personal metrics you track -->
+### Theme/Focus for Next Month:
 
-            ### Health Metrics:
+### Top 3 Goals:
 
-            **Exercise days**: /30
-            **Sleep average**: hours
-            **Energy level average**: /10
+1.
+2.
+3.
 
-            ### Productivity Metrics:
+### Areas requiring attention:
 
-            **Deep work hours**:
-            **Books read**:
-            **Articles/papers read**:
+-
+-
 
-            ### Relationship Metrics:
+### Experiments to try:
 
-            **Quality time with family**:
-            **Social activities**:
-            **New connections made**:
+-
+-
 
-            ---
+### Important dates/events:
 
-            **Tags**: #monthly-review #reflection {format_hashtags(tags)}
-            **Previous Month**: [[{(datetime.now() - timedelta(days=31)).strftime("%b-%Y")}]]
-            **Next Month**: [[{(datetime.now() + timedelta(days=28)).strftime("%b-%Y")}]]""")
+-
+-
 
-    try:
-        with note_path.open("w", encoding="utf-8") as f:
-            f.write(content)
-    except Exception as exc:
-        print(f":cross_mark: [bold red]Failed to create monthly reflection: {exc}[/bold red]")
-        raise typer.Exit(code=1) from exc
+## Metrics & Tracking
 
-    relative_path = note_path.relative_to(config.vault_path)
-    print(f":white_check_mark: [green]Monthly reflection created:[/green] {relative_path}")
+<!-- Add any personal metrics you track -->
 
+### Health Metrics:
 
-@app.command(name="weekly")
-def weekly(
-    vault_path: Annotated[Optional[Path], typer.Option("--path", "-p", help="Path to the Obsidian vault.")] = None,
-    config_file: Annotated[
-        str, typer.Option("--config", "-c", help="Path to the sb config file.")
-    ] = "~/.sb_config.yml",
-    tags: Annotated[
-        Optional[str], typer.Option("--tags", "-t", help="Comma-separated tags to include in the note.")
-    ] = None,
-) -> None:
-    """Create a new weekly review entry."""
-    try:
-        config = load_config(Path(config_file), vault_path)
-    except InvalidVaultError as exc:
-        print(f":cross_mark: [bold red]{exc}[/bold red]")
-        raise typer.Exit(code=1) from exc
+**Exercise days**: /30
+**Sleep average**: hours
+**Energy level average**: /10
 
-    weekly_path = config.vault_path / "2_Areas/Journal/Weekly-Review"
-    weekly_path.mkdir(parents=True, exist_ok=True)
+### Productivity Metrics:
 
-    this_week = f"{int(datetime.now().strftime('%W')) + 1}-{datetime.now().strftime('%Y')}"
-    note_path = weekly_path / f"{this_week}.md"
+**Deep work hours**:
+**Books read**:
+**Articles/papers read**:
 
-    if note_path.exists():
-        print(f":information: [yellow]Weekly review for {this_week} already exists.[/yellow]")
-        raise typer.Exit(code=0)
+### Relationship Metrics:
 
-    created_date = datetime.now().strftime("%Y-%m-%d")
+**Quality time with family**:
+**Social activities**:
+**New connections made**:
 
-    inbox_path = config.vault_path / config.inbox_folder
-    inbox_files: list[str] = []
-    if inbox_path.exists() and inbox_path.is_dir():
-        inbox_files = [path.stem for path in list(inbox_path.glob("*.md"))]
+---
 
-    items_to_process = (
-        "\n".join(f"- [ ] [[{item}]] → Move to:" for item in inbox_files) if inbox_files else "- [ ] No items in inbox."
-    )
+**Tags**: #monthly-review #reflection {tags}
+**Previous Month**: [[{previous}]]
+**Next Month**: [[{next}]]"""
 
-    content = textwrap.dedent(f"""\
-# Week {this_week.replace("-", " - ")} Review
+WEEKLY_TEMPLATE = """\
+# Week {title} Review
 
-**Review Date**: {created_date}
+**Review Date**: {date}
 **Energy This Week**: /10
 **Overall Rating**: /10
 
@@ -286,7 +210,7 @@ def weekly(
 
 ### Items to Process:
 
-{items_to_process}
+{inbox_items}
 
 ## Projects Review
 
@@ -350,23 +274,62 @@ def weekly(
 
 ---
 
-**Tags**: #weekly-review #reflection {format_hashtags(tags)}
-**Previous Week**: [[{(datetime.now() - timedelta(weeks=1)).strftime("%W-%Y")}]]
-**Next Week**: [[{(datetime.now() + timedelta(weeks=1)).strftime("%W-%Y")}]]""")
+**Tags**: #weekly-review #reflection {tags}
+**Previous Week**: [[{previous}]]
+**Next Week**: [[{next}]]"""
 
-    try:
-        with note_path.open("w", encoding="utf-8") as f:
-            f.write(content)
-    except Exception as exc:
-        print(f":cross_mark: [bold red]Failed to create weekly review: {exc}[/bold red]")
-        raise typer.Exit(code=1) from exc
+DAILY_TEMPLATE = """\
+# {date}
 
-    relative_path = note_path.relative_to(config.vault_path)
-    print(f":white_check_mark: [green]Weekly review created:[/green] {relative_path}")
+## Daily Goals
 
+- [ ] 15 minutes of touch typing practice
+- [ ] Review and prioritize tasks for the day
+- [ ] Read three pages of the Bible
+- [ ] 3 Sporcle quizzes
 
-@app.command(name="daily")
-def daily(
+## Today's Focus
+
+- [ ]
+
+## What I Did
+
+### Work/Projects
+
+### Personal
+
+### Learning
+
+## Reflections
+
+### What went well?
+
+### What could be improved?
+
+### Tomorrow's priorities
+
+-
+
+## Captured Ideas
+
+<!-- Quick thoughts, links, or ideas to process later -->
+
+---
+
+**Created**: {date} at {time}
+**Energy Level**: /10
+**Mood**:
+**Weather**:
+**Tags**: #daily-journal #reflection {tags}
+**Yesterday**: [[{yesterday}]]
+**Tomorrow**: [[{tomorrow}]]
+
+---
+"""
+
+
+@app.command(name="monthly")
+def monthly(
     vault_path: Annotated[Optional[Path], typer.Option("--path", "-p", help="Path to the Obsidian vault.")] = None,
     config_file: Annotated[
         str, typer.Option("--config", "-c", help="Path to the sb config file.")
@@ -375,82 +338,147 @@ def daily(
         Optional[str], typer.Option("--tags", "-t", help="Comma-separated tags to include in the note.")
     ] = None,
 ) -> None:
-    """Create a new daily journal entry."""
+    """Create a new monthly reflection entry."""
     try:
         config = load_config(Path(config_file), vault_path)
     except InvalidVaultError as exc:
         print(f":cross_mark: [bold red]{exc}[/bold red]")
         raise typer.Exit(code=1) from exc
 
-    daily_path = config.vault_path / "2_Areas/Journal/Daily"
-    daily_path.mkdir(parents=True, exist_ok=True)
-
-    todays_date = datetime.now().strftime("%Y-%m-%d")
-    note_path = daily_path / f"{todays_date}.md"
-
-    if note_path.exists():
-        print(f":information: [yellow]Daily note for {todays_date} already exists.[/yellow]")
-        raise typer.Exit(code=0)
-
-    created_time = datetime.now().strftime("%H:%M")
-
-    content = textwrap.dedent(f"""\
-            # {todays_date}
-
-            ## Daily Goals
-
-            - [ ] 15 minutes of touch typing practice
-            - [ ] Review and prioritize tasks for the day
-            - [ ] Read three pages of the Bible
-            - [ ] 3 Sporcle quizzes
-
-            ## Today's Focus
-
-            - [ ]
-
-            ## What I Did
-
-            ### Work/Projects
+    now = datetime.now()
+    this_month = now.strftime("%b-%Y")
+    relative_path = f"2_Areas/Journal/Monthly-Reflection/{this_month}.md"
+    note_path = config.vault_path / relative_path
+
+    created_date = now.strftime("%Y-%m-%d")
+
+    content = MONTHLY_TEMPLATE.format_map(
+        {
+            "title": this_month.replace("-", " - "),
+            "date": created_date,
+            "tags": format_hashtags(tags),
+            "previous": (now - timedelta(days=31)).strftime("%b-%Y"),
+            "next": (now + timedelta(days=28)).strftime("%b-%Y"),
+        }
+    )
 
-            ### Personal
+    try:
+        write_note(note_path, content)
+    except FileExistsError as exc:
+        print(f":information: [yellow]Monthly reflection for {this_month} already exists.[/yellow]")
+        raise typer.Exit(code=0) from exc
+    except Exception as exc:
+        print(f":cross_mark: [bold red]Failed to create monthly reflection: {exc}[/bold red]")
+        raise typer.Exit(code=1) from exc
 
-            ### Learning
+    print(f":white_check_mark: [green]Monthly reflection created:[/green] {relative_path}")
 
-            ## Reflections
 
-            ### What went well?
+@app.command(name="weekly")
+def weekly(
+    vault_path: Annotated[Optional[Path], typer.Option("--path", "-p", help="Path to the Obsidian vault.")] = None,
+    config_file: Annotated[
+        str, typer.Option("--config", "-c", help="Path to the sb config file.")
+    ] = "~/.sb_config.yml",
+    tags: Annotated[
+        Optional[str], typer.Option("--tags", "-t", help="Comma-separated tags to include in the note.")
+    ] = None,
+) -> None:
+    """Create a new weekly review entry."""
+    try:
+        config = load_config(Path(config_file), vault_path)
+    except InvalidVaultError as exc:
+        print(f":cross_mark: [bold red]{exc}[/bold red]")
+        raise typer.Exit(code=1) from exc
 
-            ### What could be improved?
+    now = datetime.now()
+    this_week = f"{int(now.strftime('%W')) + 1}-{now.strftime('%Y')}"
+    relative_path = f"2_Areas/Journal/Weekly-Review/{this_week}.md"
+    note_path = config.vault_path / relative_path
 
-            ### Tomorrow's priorities
+    created_date = now.strftime("%Y-%m-%d")
 
-            -
+    inbox_path = config.vault_path / config.inbox_folder
+    inbox_items: list[str] = []
+    if inbox_path.is_dir():
+        try:
+            with os.scandir(inbox_path) as entries:
+                inbox_items = [
+                    f"- [ ] [[{entry.name[:-3]}]] → Move to:"
+                    for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                ]
+        except OSError:
+            inbox_items = []  # An unreadable inbox is treated as empty, like Path.glob does
+
+    items_to_process = "\n".join(inbox_items) if inbox_items else "- [ ] No items in inbox."
+
+    content = WEEKLY_TEMPLATE.format_map(
+        {
+            "title": this_week.replace("-", " - "),
+            "date": created_date,
+            "inbox_items": items_to_process,
+            "tags": format_hashtags(tags),
+            "previous": (now - timedelta(weeks=1)).strftime("%W-%Y"),
+            "next": (now + timedelta(weeks=1)).strftime("%W-%Y"),
+        }
+    )
 
-            ## Captured Ideas
+    try:
+        write_note(note_path, content)
+    except FileExistsError as exc:
+        print(f":information: [yellow]Weekly review for {this_week} already exists.[/yellow]")
+        raise typer.Exit(code=0) from exc
+    except Exception as exc:
+        print(f":cross_mark: [bold red]Failed to create weekly review: {exc}[/bold red]")
+        raise typer.Exit(code=1) from exc
 
-            <!-- Quick thoughts, links, or ideas to process later -->
+    print(f":white_check_mark: [green]Weekly review created:[/green] {relative_path}")
 
-            ---
 
-            **Created**: {todays_date} at {created_time}
-            **Energy Level**: /10
-            **Mood**:
-            **Weather**:
-            **Tags**: #daily-journal #reflection {format_hashtags(tags)}
-            **Yesterday**: [[{(datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")}]]
-            **Tomorrow**: [[{(datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")}]]
+@app.command(name="daily")
+def daily(
+    vault_path: Annotated[Optional[Path], typer.Option("--path", "-p", help="Path to the Obsidian vault.")] = None,
+    config_file: Annotated[
+        str, typer.Option("--config", "-c", help="Path to the sb config file.")
+    ] = "~/.sb_config.yml",
+    tags: Annotated[
+        Optional[str], typer.Option("--tags", "-t", help="Comma-separated tags to include in the note.")
+    ] = None,
+) -> None:
+    """Create a new daily journal entry."""
+    try:
+        config = load_config(Path(config_file), vault_path)
+    except InvalidVaultError as exc:
+        print(f":cross_mark: [bold red]{exc}[/bold red]")
+        raise typer.Exit(code=1) from exc
 
-            ---
-            """)
+    now = datetime.now()
+    todays_date = now.strftime("%Y-%m-%d")
+    relative_path = f"2_Areas/Journal/Daily/{todays_date}.md"
+    note_path = config.vault_path / relative_path
+
+    created_time = now.strftime("%H:%M")
+
+    content = DAILY_TEMPLATE.format_map(
+        {
+            "date": todays_date,
+            "time": created_time,
+            "tags": format_hashtags(tags),
+            "yesterday": (now - timedelta(days=1)).strftime("%Y-%m-%d"),
+            "tomorrow": (now + timedelta(days=1)).strftime("%Y-%m-%d"),
+        }
+    )
 
     try:
-        with note_path.open("w", encoding="utf-8") as f:
-            f.write(content)
+        write_note(note_path, content)
+    except FileExistsError as exc:
+        print(f":information: [yellow]Daily note for {todays_date} already exists.[/yellow]")
+        raise typer.Exit(code=0) from exc
     except Exception as exc:
         print(f":cross_mark: [bold red]Failed to create daily journal entry: {exc}[/bold red]")
         raise typer.Exit(code=1) from exc
 
-    relative_path = note_path.relative_to(config.vault_path)
     print(f":white_check_mark: [green]Daily journal created:[/green] {relative_path}")
 
 
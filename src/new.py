@@ -2,20 +2,22 @@
 CLI tool for creating new notes in an Obsidian vault.
 """
 
-import textwrap
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich import print
+from rich import get_console
 from rich.prompt import Confirm, Prompt
 from typing_extensions import Annotated
 
 import bible
 import journal
 from config import InvalidVaultError, load_config
-from utils import daily_exists, format_hashtags, sanitize_filename
+from utils import append_to_note, daily_exists, format_hashtags, sanitize_filename, write_note
+
+print = get_console().print
 
 app = typer.Typer(
     name="new",
@@ -26,6 +28,15 @@ app.add_typer(journal.app, name="journal")
 app.add_typer(bible.app, name="bible")
 
 
+NOTE_TEMPLATE = """\
+# {title}
+
+---
+
+**Created**: {date} at {time}
+**Tags**: {tags}"""
+
+
 @app.callback(invoke_without_command=True)
 def new_callback(ctx: typer.Context):
     """
@@ -67,46 +78,45 @@ def empty(
         note_filename += ".md"
 
     inbox_path = config.vault_path / config.inbox_folder
-    inbox_path.mkdir(exist_ok=True)
-
     note_path = inbox_path / note_filename
 
-    counter = 1
-    original_path = note_path
-    while note_path.exists():
-        name_without_ext = original_path.stem
+    if note_path.exists():
+        # Read the inbox once instead of probing each candidate name in turn
+        existing = set(os.listdir(inbox_path))
+        name_without_ext = note_path.stem
+        counter = 1
+        while f"{name_without_ext}_{counter}.md" in existing:
+            counter += 1
         note_filename = f"{name_without_ext}_{counter}.md"
         note_path = inbox_path / note_filename
-        counter += 1
 
-    created_date = datetime.now().strftime("%Y-%m-%d")
-    created_time = datetime.now().strftime("%H:%M")
+    now = datetime.now()
+    created_date = now.strftime("%Y-%m-%d")
+    created_time = now.strftime("%H:%M")
 
-    daily_path = config.vault_path / "2_Areas/Journal/Daily" / (created_date + ".md")
+    daily_path = config.vault_path / f"2_Areas/Journal/Daily/{created_date}.md"
     if not daily_exists(daily_path):
         ctx.invoke(journal.daily)
         print(f":spiral_notepad: [yellow]Created daily note for {created_date}.[/yellow]")
 
-    content = textwrap.dedent(f"""\
-            # {title}
-
-            ---
-
-            **Created**: {created_date} at {created_time}
-            **Tags**: {format_hashtags(tags)}""")
+    content = NOTE_TEMPLATE.format_map(
+        {
+            "title": title,
+            "date": created_date,
+            "time": created_time,
+            "tags": format_hashtags(tags),
+        }
+    )
 
     try:
-        with note_path.open("w", encoding="utf-8") as f:
-            f.write(content)
-        with daily_path.open("a", encoding="utf-8") as f:
-            f.write(f"[[{note_filename}]]")
+        write_note(note_path, content)
+        append_to_note(daily_path, f"[[{note_filename}]]")
 
     except Exception as exc:
         print(f":cross_mark: [bold red]Failed to create note: {exc}[/bold red]")
         raise typer.Exit(code=1) from exc
 
-    relative_path = note_path.relative_to(config.vault_path)
-    print(f":white_check_mark: [green]Note created:[/green] {relative_path}")
+    print(f":white_check_mark: [green]Note created:[/green] {config.inbox_folder}/{note_filename}")
 
 
 if __name__ == "__main__":
@@ -7,19 +7,20 @@ Second Brain CLI Tool
 A command-line interface for managing your second-brain note system.
 """
 
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import git
 import typer
-from git.exc import GitCommandError, InvalidGitRepositoryError
-from rich import print
+from rich import get_console
 from typing_extensions import Annotated
 
 import new
 from config import InvalidVaultError, load_config
 
+print = get_console().print
+
 app = typer.Typer(
     name="sb",
     help="Second Brain CLI - Manage your note-taking system",
@@ -29,12 +30,33 @@ app = typer.Typer(
 app.add_typer(new.app, name="new")
 
 
+def _changed_files(status: str) -> list[str]:
+    """Extract the changed paths from `git status --porcelain=v1 -z` output.
+
+    Args:
+        status (str): NUL-separated status entries of the form "XY path".
+
+    Returns:
+        list[str]: The changed paths, with renames and copies listed once under their new path.
+    """
+    changed_files = []
+    entries = iter(status.split("\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        changed_files.append(entry[3:])
+        if "R" in entry[:2] or "C" in entry[:2]:
+            next(entries, None)  # Skip the original path of a rename or copy in either column
+    return changed_files
+
+
 @app.command(name="sync")
 def sync(
     branch: Annotated[str, typer.Argument(help="Git branch to sync with.")] = "master",
     message: Annotated[
-        str, typer.Option("--message", "-m", help="Git commit message.")
-    ] = f"vault backup: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        Optional[str],
+        typer.Option("--message", "-m", help="Git commit message. Defaults to 'vault backup: <current time>'."),
+    ] = None,
     vault_path: Annotated[Optional[Path], typer.Option("--path", "-p", help="Path to the Obsidian vault.")] = None,
     config_file: Annotated[
         str, typer.Option("--config", "-c", help="Path to the sb config file.")
@@ -45,6 +67,10 @@ def sync(
     First pulls changes from the remote repository and rebases local commits on top of them, then pushes
     local commits to the remote repository.
     """
+    # GitPython is slow to import, so only load it for the command that needs it
+    import git
+    from git.exc import GitCommandError, InvalidGitRepositoryError
+
     try:
         config = load_config(Path(config_file), vault_path)
     except InvalidVaultError as exc:
@@ -55,19 +81,17 @@ def sync(
         f":brain: Syncing Second Brain Vault at [green]{config.vault_path}[/green] with remote repository branch [cyan]{branch}[/cyan]..."
     )
 
+    if message is None:
+        message = f"vault backup: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+
     try:
         git_repo = git.Repo(config.vault_path)
 
         current_branch = git_repo.active_branch.name
         print(f"Current local branch: [cyan]{current_branch}[/cyan]")
 
-        if git_repo.is_dirty(untracked_files=True):
-            changed_files = []
-            if diff := git_repo.index.diff(None):
-                changed_files.extend([file.a_path for file in diff])
-            if untracked := git_repo.untracked_files:
-                changed_files.extend(untracked)
-
+        status = git_repo.git.status("--porcelain=v1", "-z", "--untracked-files=all")
+        if changed_files := _changed_files(status):
             print(f"\n:package: Staging {len(changed_files)} file(s)...")
             git_repo.git.add(A=True)
 
@@ -76,12 +100,11 @@ def sync(
             print(f":pencil: Message: '{message}'")
             print(f":keycap_number_sign: Commit hash: {commit.hexsha[:7]}")
 
-            if changed_files:
-                print("\n:open_file_folder: Changed files:")
-                for f in changed_files[:10]:  # Show first 10 files
-                    print(f"   - {f}")
-                if len(changed_files) > 10:
-                    print(f"   ... and {len(changed_files) - 10} more")
+            print("\n:open_file_folder: Changed files:")
+            for f in changed_files[:10]:  # Show first 10 files
+                print(f"   - {f}")
+            if len(changed_files) > 10:
+                print(f"   ... and {len(changed_files) - 10} more")
         else:
             print(":white_check_mark: No changes to commit.")
 
@@ -133,6 +156,42 @@ def sync(
         raise typer.Exit(code=1) from exc
 
 
+def _scan_md(path: str, subdirs: list[str]) -> int:
+    """Count the `.md` entries in a single directory, collecting its subdirectories.
+
+    Directories that cannot be read are skipped, like `Path.glob` does.
+    """
+    count = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md"):
+                    count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return count
+
+
+def _count_md(root: str) -> tuple[int, int]:
+    """Count the markdown files in a directory tree.
+
+    Args:
+        root (str): The directory to search recursively.
+
+    Returns:
+        tuple[int, int]: The number of `.md` entries under the directory, and how many of those
+            are directly inside it.
+    """
+    stack: list[str] = []
+    top_level = _scan_md(root, stack)
+    count = top_level
+    while stack:
+        count += _scan_md(stack.pop(), stack)
+    return count, top_level
+
+
 @app.command(name="info")
 def info(
     vault_path: Annotated[Optional[Path], typer.Option("--path", "-p", help="Path to the Obsidian vault.")] = None,
@@ -141,6 +200,9 @@ def info(
     ] = "~/.sb_config.yml",
 ) -> None:
     """Display information about the current vault and system status."""
+    # concurrent.futures pulls in logging, so keep it off the import path of the other commands
+    from concurrent.futures import ThreadPoolExecutor
+
     try:
         config = load_config(Path(config_file), vault_path)
     except InvalidVaultError as exc:
@@ -149,29 +211,47 @@ def info(
 
     print(f":brain: Second Brain Vault: [green]{config.vault_path}[/green]")
 
-    # Check folder structure
+    # Check folder structure with a single listing of the vault root
+    try:
+        with os.scandir(config.vault_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        entries = {}
+
     folders = ["0_Inbox", "1_Projects", "2_Areas", "3_Resources", "4_Archive"]
+
+    # The folder trees are independent, so walk them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=len(folders)) as executor:
+        counts = {
+            folder: executor.submit(_count_md, entry.path)
+            for folder in folders
+            if (entry := entries.get(folder)) is not None and entry.is_dir()
+        }
+
+    top_level_counts: dict[str, int] = {}
     print("\n:open_file_folder: Folder Structure:")
     for folder in folders:
-        folder_path = config.vault_path / folder
-        if folder_path.exists() and folder_path.is_dir():
-            md_files = list(folder_path.glob("**/*.md"))
-            print(f"\t:white_check_mark: [green]{folder}[/green] ({len(md_files)} notes)")
+        if folder in counts:
+            note_count, top_level_counts[folder] = counts[folder].result()
+            print(f"\t:white_check_mark: [green]{folder}[/green] ({note_count} notes)")
         else:
             print(f"\t:cross_mark: [red]{folder} (missing)[/red]")
 
-    # Inbox status
-    inbox_path = config.vault_path / config.inbox_folder
-    if inbox_path.exists() and inbox_path.is_dir():
-        inbox_files = list(inbox_path.glob("*.md"))
-        if inbox_files:
-            print(f"\n:inbox_tray: Inbox has [yellow]{len(inbox_files)}[/yellow] unprocessed notes")
-            if len(inbox_files) > 5:
-                print("\t:light_bulb: [yellow]Consider doing a weekly review![/yellow]")
-        else:
-            print("\n:inbox_tray: Inbox is empty :sparkles:")
-    else:
+    # Inbox status, reusing the count from the folder pass when the inbox is one of the folders
+    inbox_count = top_level_counts.get(config.inbox_folder)
+    if inbox_count is None:
+        inbox_path = config.vault_path / config.inbox_folder
+        if inbox_path.is_dir():
+            inbox_count = _scan_md(os.fspath(inbox_path), [])
+
+    if inbox_count is None:
         print(f"\n:cross_mark: [red]{config.inbox_folder} folder is missing![/red]")
+    elif inbox_count:
+        print(f"\n:inbox_tray: Inbox has [yellow]{inbox_count}[/yellow] unprocessed notes")
+        if inbox_count > 5:
+            print("\t:light_bulb: [yellow]Consider doing a weekly review![/yellow]")
+    else:
+        print("\n:inbox_tray: Inbox is empty :sparkles:")
 
 
 if __name__ == "__main__":
@@ -7,12 +7,22 @@ Functions:
     - find_vault_root: Locate the root of the second-brain vault.
     - sanitize_filename: Convert titles to safe filenames.
     - format_hashtags: Format a string of hashtags.
+    - write_note: Write the content of a new note in one go.
+    - append_to_note: Append text to a note in one go.
 """
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Tables and patterns used by sanitize_filename, built once at import
+_VALID_FILENAME_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_")
+_SPACES_TO_UNDERSCORES = bytes.maketrans(b" ", b"_")
+_INVALID_FILENAME_BYTES = bytes(i for i in range(128) if i not in _VALID_FILENAME_BYTES and i != ord(" "))
+_REPEATED_SEPARATORS = re.compile(r"([-_])\1+")
+
 
 def daily_exists(daily_path: Path) -> bool:
     """Check if a daily note for the given date already exists in the inbox.
@@ -23,31 +33,42 @@ def daily_exists(daily_path: Path) -> bool:
     Returns:
         bool: True if the daily note exists, False otherwise.
     """
-    return daily_path.exists()
+    return os.path.exists(daily_path)
 
 
-def find_vault_root(vault_name: str) -> Optional[Path]:
+def find_vault_root(vault_name: str, start: Optional[Path] = None) -> Optional[Path]:
     """Find the second-brain vault by searching up the directory tree.
 
+    The search is cached per starting directory, so repeated lookups in one process only walk the
+    tree once.
+
     Args:
         vault_name (str): The name of the vault directory to search for.
+        start (Optional[Path]): The directory to start searching from. Defaults to the current
+            working directory.
 
     Returns:
         Optional[Path]: The path to the vault root if found, otherwise None.
     """
-    current = Path.cwd()
-
     if not vault_name:
         return None
 
-    # Search up the directory tree
-    while current != current.parent:
-        if current.name == vault_name:
-            return current
-        potential_vault = current / vault_name
-        if potential_vault.exists() and potential_vault.is_dir():
-            return potential_vault
-        current = current.parent
+    current = os.getcwd() if start is None else os.path.abspath(start)
+    return _find_vault_root_from(current, vault_name)
+
+
+@lru_cache(maxsize=8)
+def _find_vault_root_from(current: str, vault_name: str) -> Optional[Path]:
+    """Search up the directory tree from `current` for the vault named `vault_name`."""
+    # Walk on plain strings, building a Path only for the match
+    parent = os.path.dirname(current)
+    while current != parent:
+        if os.path.basename(current) == vault_name:
+            return Path(current)
+        potential_vault = os.path.join(current, vault_name)
+        if os.path.isdir(potential_vault):
+            return Path(potential_vault)
+        current, parent = parent, os.path.dirname(parent)
 
     return None
 
@@ -63,10 +84,14 @@ def sanitize_filename(title: str) -> str:
     Returns:
         str: A sanitized filename.
     """
-    filename = title.strip().replace(" ", "_")
-    filename = re.sub(r"[^a-zA-Z0-9\-_]", "", filename)
-    filename = re.sub(r"-+", "-", filename)
-    filename = re.sub(r"_+", "_", filename)
+    # Non-ASCII characters are never valid, so drop them and filter the rest as bytes
+    filename = (
+        title.strip()
+        .encode("ascii", "ignore")
+        .translate(_SPACES_TO_UNDERSCORES, _INVALID_FILENAME_BYTES)
+        .decode("ascii")
+    )
+    filename = _REPEATED_SEPARATORS.sub(r"\1", filename)
     filename = filename.strip("-_")
 
     if not filename:
@@ -75,9 +100,12 @@ def sanitize_filename(title: str) -> str:
     return filename.lower()
 
 
+@lru_cache(maxsize=128)
 def format_hashtags(hashtags: Optional[str]) -> str:
     """Format a comma-separated string of hashtags into a space-separated string.
 
+    Results are cached per tag string.
+
     Args:
         hashtags (Optional[str]): Comma-separated hashtags.
 
@@ -87,5 +115,52 @@ def format_hashtags(hashtags: Optional[str]) -> str:
     if not hashtags:
         return ""
 
-    tags = [tag.strip() for tag in hashtags.split(",") if tag.strip()]
-    return " ".join(f"#{tag}" for tag in tags)
+    return " ".join([f"#{tag}" for tag in map(str.strip, hashtags.split(",")) if tag])
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of `data` to a file descriptor, retrying after short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def write_note(note_path: Path, content: str) -> None:
+    """Write the content of a new note with a single low-level write.
+
+    The file is created exclusively, so an existing note is never overwritten.
+    Missing parent directories are only created when the first attempt fails.
+
+    Args:
+        note_path (Path): The path of the note to create.
+        content (str): The full content of the note.
+
+    Raises:
+        FileExistsError: If a note already exists at the given path.
+    """
+    data = content.encode("utf-8")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        fd = os.open(note_path, flags, 0o666)
+    except FileNotFoundError:
+        note_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(note_path, flags, 0o666)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def append_to_note(note_path: Path, text: str) -> None:
+    """Append text to a note with a single low-level write.
+
+    Args:
+        note_path (Path): The path of the note to append to. It is created if missing.
+        text (str): The text to append.
+    """
+    data = text.encode("utf-8")
+    fd = os.open(note_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
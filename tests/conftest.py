@@ -0,0 +1,18 @@
+"""
+Shared pytest configuration for the sb-cli test suite.
+"""
+
+import os
+import tempfile
+
+RAM_DISK = "/dev/shm"
+
+
+def pytest_configure(config):
+    """Keep temporary vaults on a RAM disk when one is available.
+
+    The integration tests create and remove many small temporary trees, so placing them on tmpfs avoids
+    disk I/O. An explicit TMPDIR always takes precedence.
+    """
+    if "TMPDIR" not in os.environ and os.path.isdir(RAM_DISK) and os.access(RAM_DISK, os.W_OK):
+        tempfile.tempdir = RAM_DISK
@@ -262,9 +262,13 @@ class TestChapterCommandIntegration(unittest.TestCase):
 class TestChapterCLIIntegration(unittest.TestCase):
     """Integration tests for the bible chapter CLI command."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up a CLI runner shared by the tests."""
+        cls.runner = CliRunner()
+
     def setUp(self):
-        """Set up CLI runner and temporary vault."""
-        self.runner = CliRunner()
+        """Set up temporary vault."""
         self.temp_dir = tempfile.TemporaryDirectory()
         self.temp_path = Path(self.temp_dir.name)
         self.vault_path = self.temp_path / "test_vault"
@@ -16,6 +16,10 @@ from config import Config, InvalidVaultError, load_config
 class TestConfigIntegration(unittest.TestCase):
     """Integration tests for configuration loading with real file system."""
 
+    def setUp(self):
+        """Clear the load_config cache between tests."""
+        load_config.cache_clear()
+
     def test_config_load_integration_valid_file(self):
         """Integration test for Config.load with real YAML file."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -103,6 +107,22 @@ class TestConfigIntegration(unittest.TestCase):
 
             self.assertIn("Invalid vault path:", str(context.exception))
 
+    def test_load_config_vault_path_is_file_integration(self):
+        """Integration test with a vault path that points to a regular file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.yaml"
+            not_a_dir = Path(temp_dir) / "vault.md"
+            not_a_dir.write_text("# Not a vault")
+
+            config_data = {"vault_path": str(not_a_dir)}
+            with open(config_path, "w") as f:
+                yaml.dump(config_data, f)
+
+            with self.assertRaises(InvalidVaultError) as context:
+                load_config(config_path, vault_path=None)
+
+            self.assertIn("Invalid vault path:", str(context.exception))
+
     def test_load_config_non_obsidian_integration(self):
         """Integration test with directory that is not an Obsidian vault."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -151,6 +171,10 @@ class TestConfigIntegration(unittest.TestCase):
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and boundary conditions."""
 
+    def setUp(self):
+        """Clear the load_config cache between tests."""
+        load_config.cache_clear()
+
     def test_config_with_only_inbox(self):
         """Test config file that only specifies inbox_folder."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -165,7 +189,7 @@ class TestEdgeCases(unittest.TestCase):
             self.assertEqual(result.inbox_folder, "0_TestInbox")
 
     def test_config_with_extra_fields(self):
-        """Test config file with extra fields (should be ignored by Pydantic)."""
+        """Test config file with extra fields (should be ignored)."""
         with tempfile.TemporaryDirectory() as temp_dir:
             config_path = Path(temp_dir) / "config.yaml"
             config_data = {
@@ -97,6 +97,30 @@ class TestEmptyCommandIntegration(unittest.TestCase):
         expected_file = self.vault_path / "0_Inbox" / "duplicate_note_1.md"
         self.assertTrue(expected_file.exists())
 
+    @patch("new.load_config")
+    def test_empty_uses_first_free_counter_suffix(self, mock_load_config):
+        """Test that the first unused counter suffix is picked for duplicates."""
+        mock_config = Config(vault_path=self.vault_path, inbox_folder="0_Inbox")
+        mock_load_config.return_value = mock_config
+
+        inbox = self.vault_path / "0_Inbox"
+        for name in ("duplicate_note.md", "duplicate_note_1.md", "duplicate_note_2.md", "duplicate_note_4.md"):
+            (inbox / name).write_text("# Existing note")
+
+        ctx = MagicMock()
+        with patch("new.print"):
+            with patch("new.daily_exists", return_value=True):
+                empty(
+                    ctx,
+                    title="Duplicate Note",
+                    vault_path=self.vault_path,
+                    config_file="~/.sb_config.yml",
+                    tags=None,
+                )
+
+        self.assertIn("# Duplicate Note", (inbox / "duplicate_note_3.md").read_text())
+        self.assertEqual((inbox / "duplicate_note_4.md").read_text(), "# Existing note")
+
     @patch("new.load_config")
     def test_empty_creates_inbox_if_missing(self, mock_load_config):
         """Test that empty command creates inbox folder if it doesn't exist."""
@@ -187,6 +211,28 @@ class TestEmptyCommandIntegration(unittest.TestCase):
         content = note_path.read_text(encoding="utf-8")
         self.assertIn("# Meeting @2024 #Goals!", content)
 
+    @patch("new.load_config")
+    def test_empty_multiline_title_keeps_template_unindented(self, mock_load_config):
+        """Test that a multi-line title does not leave the note body indented."""
+        mock_config = Config(vault_path=self.vault_path, inbox_folder="0_Inbox")
+        mock_load_config.return_value = mock_config
+
+        ctx = MagicMock()
+        with patch("new.print"):
+            with patch("new.daily_exists", return_value=True):
+                empty(
+                    ctx,
+                    title="First line\nSecond line",
+                    vault_path=self.vault_path,
+                    config_file="~/.sb_config.yml",
+                    tags="multi",
+                )
+
+        note_path = self.vault_path / "0_Inbox" / "first_linesecond_line.md"
+        content = note_path.read_text(encoding="utf-8")
+        self.assertTrue(content.startswith("# First line\nSecond line\n\n---\n"))
+        self.assertIn("\n**Tags**: #multi", content)
+
     @patch("new.load_config")
     def test_empty_reports_relative_path(self, mock_load_config):
         """Test that empty command prints the relative path to the created note."""
@@ -210,9 +256,13 @@ class TestEmptyCommandIntegration(unittest.TestCase):
 class TestNewCLIIntegration(unittest.TestCase):
     """Integration tests for new.py CLI interface."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up a CLI runner shared by the tests."""
+        cls.runner = CliRunner()
+
     def setUp(self):
-        """Set up CLI runner and temporary vault."""
-        self.runner = CliRunner()
+        """Set up temporary vault."""
         self.temp_dir = tempfile.TemporaryDirectory()
         self.temp_path = Path(self.temp_dir.name)
         self.vault_path = self.temp_path / "test_vault"
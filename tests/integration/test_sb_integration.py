@@ -3,6 +3,7 @@ Integration tests for sb.py module.
 Test component interactions with real file system and Git operations where possible.
 """
 
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
@@ -11,197 +12,199 @@ from unittest.mock import MagicMock, patch
 import git
 import typer
 import yaml
+from parameterized import parameterized
 from typer.testing import CliRunner
 
-from config import Config
+from config import Config, InvalidVaultError
 from sb import app, info, sync
 
+SYNC_MAIN_MESSAGE = (
+    ":brain: Syncing Second Brain Vault at [green]{}[/green] with remote repository branch [cyan]main[/cyan]..."
+)
+
 
 class TestSyncCommandIntegration(unittest.TestCase):
     """Integration tests for sync command."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create a template Git repository once, to be copied by each test."""
+        cls.template_dir = tempfile.TemporaryDirectory()
+        cls.template_path = Path(cls.template_dir.name) / "repo"
+        repo = git.Repo.init(cls.template_path)
+
+        # Append minimal git config to the freshly initialised config file
+        with open(cls.template_path / ".git" / "config", "a") as config:
+            config.write("[user]\n\tname = Test User\n\temail = test@example.com\n[gc]\n\tauto = 0\n")
+
+        # Create initial commit
+        readme_path = cls.template_path / "README.md"
+        readme_path.write_text("# Test Vault")
+        repo.index.add(["README.md"])
+        repo.index.commit("Initial commit")
+        repo.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the template repository."""
+        cls.template_dir.cleanup()
+
     def setUp(self):
-        """Set up temporary directory for tests."""
+        """Set up temporary directory for tests and patch the config loader and output."""
         self.temp_dir = tempfile.TemporaryDirectory()
         self.temp_path = Path(self.temp_dir.name)
 
+        load_config_patcher = patch("sb.load_config")
+        self.mock_load_config = load_config_patcher.start()
+        self.addCleanup(load_config_patcher.stop)
+
+        print_patcher = patch("sb.print")
+        self.mock_print = print_patcher.start()
+        self.addCleanup(print_patcher.stop)
+
     def tearDown(self):
         """Clean up temporary directory."""
         self.temp_dir.cleanup()
 
     def create_test_repo(self, repo_path):
-        """Helper to create a test Git repository."""
-        repo = git.Repo.init(repo_path)
-
-        # Set minimal git config
-        with repo.config_writer() as config:
-            config.set_value("user", "name", "Test User")
-            config.set_value("user", "email", "test@example.com")
-
-        # Create initial commit
-        readme_path = repo_path / "README.md"
-        readme_path.write_text("# Test Vault")
-        repo.index.add(["README.md"])
-        repo.index.commit("Initial commit")
+        """Helper to create a test Git repository from the class template."""
+        shutil.copytree(self.template_path, repo_path, dirs_exist_ok=True)
+        return git.Repo(repo_path)
 
-        return repo
+    def create_test_vault(self, vault_name="test_vault"):
+        """Helper to create a test vault with an .obsidian folder inside a Git repository."""
+        vault_path = self.temp_path / vault_name
+        (vault_path / ".obsidian").mkdir(parents=True)
+        self.create_test_repo(vault_path)
+        return vault_path
 
-    @patch("sb.load_config")
-    def test_sync_integration_valid_repo(self, mock_load_config):
+    def test_sync_integration_valid_repo(self):
         """Integration test for sync with valid Git repository."""
         # Create test vault with Git repo
-        vault_path = self.temp_path / "test_vault"
-        obsidian_dir = vault_path / ".obsidian"
-        vault_path.mkdir()
-        obsidian_dir.mkdir()
-
-        self.create_test_repo(vault_path)
-
-        # Mock config
-        mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
+        vault_path = self.create_test_vault()
+        self.mock_load_config.return_value = Config(vault_path=vault_path, inbox_folder="0_Inbox")
 
         # Create a new file to trigger changes
         test_file = vault_path / "test_note.md"
         test_file.write_text("# Test Note")
 
-        with patch("sb.print") as mock_print:
-            # This will fail on push since we don't have a remote, but should work up to that point
-            try:
-                sync("main", "Test integration commit", vault_path)
-            except typer.Exit:
-                pass  # Expected to fail on push
-
-            # Verify operations up to push were attempted
-            mock_print.assert_any_call(
-                ":brain: Syncing Second Brain Vault at [green]{}[/green] with remote repository branch [cyan]main[/cyan]...".format(
-                    vault_path
-                )
-            )
-            mock_print.assert_any_call("\n:package: Staging 1 file(s)...")
+        # This will fail on push since we don't have a remote, but should work up to that point
+        try:
+            sync("main", "Test integration commit", vault_path)
+        except typer.Exit:
+            pass  # Expected to fail on push
 
-    @patch("sb.load_config")
-    def test_sync_integration_no_changes(self, mock_load_config):
-        """Integration test for sync with no changes."""
-        vault_path = self.temp_path / "test_vault"
-        obsidian_dir = vault_path / ".obsidian"
-        vault_path.mkdir()
-        obsidian_dir.mkdir()
+        # Verify operations up to push were attempted
+        self.mock_print.assert_any_call(SYNC_MAIN_MESSAGE.format(vault_path))
+        self.mock_print.assert_any_call("\n:package: Staging 1 file(s)...")
 
-        self.create_test_repo(vault_path)
-
-        # Mock config
-        mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
+    def test_sync_integration_no_changes(self):
+        """Integration test for sync with no changes."""
+        vault_path = self.create_test_vault()
+        self.mock_load_config.return_value = Config(vault_path=vault_path, inbox_folder="0_Inbox")
 
-        with patch("sb.print") as mock_print:
-            try:
-                sync("main", "Test commit", vault_path)
-            except typer.Exit:
-                pass
+        try:
+            sync("main", "Test commit", vault_path)
+        except typer.Exit:
+            pass
 
-            # Verify no changes message
-            mock_print.assert_any_call(":white_check_mark: No changes to commit.")
+        # Verify no changes message
+        self.mock_print.assert_any_call(":white_check_mark: No changes to commit.")
 
-    @patch("sb.load_config")
-    def test_sync_integration_multiple_files(self, mock_load_config):
+    def test_sync_integration_multiple_files(self):
         """Integration test for sync with multiple file changes."""
-        vault_path = self.temp_path / "test_vault"
-        obsidian_dir = vault_path / ".obsidian"
-        vault_path.mkdir()
-        obsidian_dir.mkdir()
-
-        self.create_test_repo(vault_path)
-
-        # Mock config
-        mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
+        vault_path = self.create_test_vault()
+        self.mock_load_config.return_value = Config(vault_path=vault_path, inbox_folder="0_Inbox")
 
         # Create multiple files
         for i in range(5):
             file_path = vault_path / f"note_{i}.md"
             file_path.write_text(f"# Note {i}")
 
-        with patch("sb.print") as mock_print:
-            try:
-                sync("main", "Multiple files commit", vault_path)
-            except typer.Exit:
-                pass
+        try:
+            sync("main", "Multiple files commit", vault_path)
+        except typer.Exit:
+            pass
 
-            # Verify multiple files were processed
-            mock_print.assert_any_call("\n:package: Staging 5 file(s)...")
+        # Verify multiple files were processed
+        self.mock_print.assert_any_call("\n:package: Staging 5 file(s)...")
 
-    @patch("sb.load_config")
-    def test_sync_integration_with_config_file(self, mock_load_config):
+    def test_sync_integration_modified_and_nested_files(self):
+        """Integration test for sync counting modified files and files in new folders."""
+        vault_path = self.create_test_vault()
+        self.mock_load_config.return_value = Config(vault_path=vault_path, inbox_folder="0_Inbox")
+
+        (vault_path / "README.md").write_text("# Updated Vault")
+        nested = vault_path / "1_Projects" / "New"
+        nested.mkdir(parents=True)
+        (nested / "a.md").write_text("# A")
+        (nested / "b.md").write_text("# B")
+
+        try:
+            sync("main", "Nested files commit", vault_path)
+        except typer.Exit:
+            pass
+
+        self.mock_print.assert_any_call("\n:package: Staging 3 file(s)...")
+        self.mock_print.assert_any_call("   - README.md")
+        self.mock_print.assert_any_call("   - 1_Projects/New/a.md")
+
+    def test_sync_integration_with_config_file(self):
         """Integration test for sync using config file."""
         # Create config file
         config_path = self.temp_path / "config.yaml"
-        vault_path = self.temp_path / "test_vault"
-        obsidian_dir = vault_path / ".obsidian"
-        vault_path.mkdir()
-        obsidian_dir.mkdir()
-
-        self.create_test_repo(vault_path)
+        vault_path = self.create_test_vault()
 
         config_data = {"vault_path": str(vault_path), "inbox_folder": "0_CustomInbox"}
         with open(config_path, "w") as f:
             yaml.dump(config_data, f)
 
         # Mock config loading to use our file
-        with patch("sb.load_config") as mock_load:
-            mock_config = Config(vault_path=vault_path, inbox_folder="0_CustomInbox")
-            mock_load.return_value = mock_config
+        mock_config = Config(vault_path=vault_path, inbox_folder="0_CustomInbox")
+        self.mock_load_config.return_value = mock_config
 
-            with patch("sb.print"):
-                try:
-                    sync("main", config_file=str(config_path))
-                except typer.Exit:
-                    pass
+        try:
+            sync("main", config_file=str(config_path))
+        except typer.Exit:
+            pass
 
-                # Verify config was used
-                mock_load.assert_called_once()
+        # Verify config was used
+        self.mock_load_config.assert_called_once()
 
-    @patch("sb.load_config")
-    def test_sync_integration_special_characters(self, mock_load_config):
+    def test_sync_integration_special_characters(self):
         """Integration test for sync with special characters in paths."""
-        vault_name = "vault with spaces & (special) chars"
-        vault_path = self.temp_path / vault_name
-        obsidian_dir = vault_path / ".obsidian"
-        vault_path.mkdir()
-        obsidian_dir.mkdir()
-
-        self.create_test_repo(vault_path)
-
-        # Mock config
-        mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
+        vault_path = self.create_test_vault("vault with spaces & (special) chars")
+        self.mock_load_config.return_value = Config(vault_path=vault_path, inbox_folder="0_Inbox")
 
         # Create file with special characters
         test_file = vault_path / "note with spaces.md"
         test_file.write_text("# Note with spaces")
 
-        with patch("sb.print") as mock_print:
-            try:
-                sync("main", "Special chars test", vault_path)
-            except typer.Exit:
-                pass
+        try:
+            sync("main", "Special chars test", vault_path)
+        except typer.Exit:
+            pass
 
-            # Verify operations proceeded normally
-            mock_print.assert_any_call(
-                ":brain: Syncing Second Brain Vault at [green]{}[/green] with remote repository branch [cyan]main[/cyan]...".format(
-                    vault_path
-                )
-            )
+        # Verify operations proceeded normally
+        self.mock_print.assert_any_call(SYNC_MAIN_MESSAGE.format(vault_path))
 
 
 class TestInfoCommandIntegration(unittest.TestCase):
     """Integration tests for info command."""
 
     def setUp(self):
-        """Set up temporary directory for tests."""
+        """Set up temporary directory for tests and patch the config loader and output."""
         self.temp_dir = tempfile.TemporaryDirectory()
         self.temp_path = Path(self.temp_dir.name)
 
+        load_config_patcher = patch("sb.load_config")
+        self.mock_load_config = load_config_patcher.start()
+        self.addCleanup(load_config_patcher.stop)
+
+        print_patcher = patch("sb.print")
+        self.mock_print = print_patcher.start()
+        self.addCleanup(print_patcher.stop)
+
     def tearDown(self):
         """Clean up temporary directory."""
         self.temp_dir.cleanup()
@@ -223,8 +226,7 @@ class TestInfoCommandIntegration(unittest.TestCase):
         obsidian_dir = vault_path / ".obsidian"
         obsidian_dir.mkdir()
 
-    @patch("sb.load_config")
-    def test_info_integration_complete_vault(self, mock_load_config):
+    def test_info_integration_complete_vault(self):
         """Integration test for info with complete vault structure."""
         vault_path = self.temp_path / "test_vault"
         vault_path.mkdir()
@@ -232,19 +234,52 @@ class TestInfoCommandIntegration(unittest.TestCase):
 
         # Mock config
         mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
+        self.mock_load_config.return_value = mock_config
 
-        with patch("sb.print") as mock_print:
-            info(vault_path=vault_path)
+        info(vault_path=vault_path)
 
-            # Verify vault info was displayed
-            mock_print.assert_any_call(":brain: Second Brain Vault: [green]{}[/green]".format(vault_path))
+        # Verify vault info was displayed
+        self.mock_print.assert_any_call(":brain: Second Brain Vault: [green]{}[/green]".format(vault_path))
 
-            # Verify all folders were checked
-            mock_print.assert_any_call("\t:white_check_mark: [green]0_Inbox[/green] (2 notes)")
+        # Verify all folders were checked
+        self.mock_print.assert_any_call("\t:white_check_mark: [green]0_Inbox[/green] (2 notes)")
 
-    @patch("sb.load_config")
-    def test_info_integration_partial_vault(self, mock_load_config):
+    def test_info_integration_counts_nested_notes(self):
+        """Integration test for info counting notes in nested folders only."""
+        vault_path = self.temp_path / "test_vault"
+        vault_path.mkdir()
+        self.create_test_vault_structure(vault_path)
+
+        nested = vault_path / "3_Resources" / "Books" / "Fiction"
+        nested.mkdir(parents=True)
+        (nested / "novel.md").write_text("# Novel")
+        (nested / "cover.png").write_bytes(b"")
+        (vault_path / "3_Resources" / "Books" / "index.md").write_text("# Books")
+
+        self.mock_load_config.return_value = Config(vault_path=vault_path, inbox_folder="0_Inbox")
+
+        info(vault_path=vault_path)
+
+        self.mock_print.assert_any_call("\t:white_check_mark: [green]3_Resources[/green] (4 notes)")
+
+    def test_info_integration_inbox_counts_top_level_notes(self):
+        """Integration test for info reporting only top-level inbox notes as unprocessed."""
+        vault_path = self.temp_path / "test_vault"
+        vault_path.mkdir()
+        self.create_test_vault_structure(vault_path)
+
+        nested = vault_path / "0_Inbox" / "clippings"
+        nested.mkdir()
+        (nested / "clip.md").write_text("# Clip")
+
+        self.mock_load_config.return_value = Config(vault_path=vault_path, inbox_folder="0_Inbox")
+
+        info(vault_path=vault_path)
+
+        self.mock_print.assert_any_call("\t:white_check_mark: [green]0_Inbox[/green] (3 notes)")
+        self.mock_print.assert_any_call("\n:inbox_tray: Inbox has [yellow]2[/yellow] unprocessed notes")
+
+    def test_info_integration_partial_vault(self):
         """Integration test for info with partial vault structure."""
         vault_path = self.temp_path / "test_vault"
         vault_path.mkdir()
@@ -266,16 +301,14 @@ class TestInfoCommandIntegration(unittest.TestCase):
 
         # Mock config
         mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
+        self.mock_load_config.return_value = mock_config
 
-        with patch("sb.print") as mock_print:
-            info(vault_path=vault_path)
+        info(vault_path=vault_path)
 
-            # Verify missing folders are reported
-            mock_print.assert_any_call("\t:cross_mark: [red]2_Areas (missing)[/red]")
+        # Verify missing folders are reported
+        self.mock_print.assert_any_call("\t:cross_mark: [red]2_Areas (missing)[/red]")
 
-    @patch("sb.load_config")
-    def test_info_integration_empty_inbox(self, mock_load_config):
+    def test_info_integration_empty_inbox(self):
         """Integration test for info with empty inbox."""
         vault_path = self.temp_path / "test_vault"
         vault_path.mkdir()
@@ -290,16 +323,14 @@ class TestInfoCommandIntegration(unittest.TestCase):
 
         # Mock config
         mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
+        self.mock_load_config.return_value = mock_config
 
-        with patch("sb.print") as mock_print:
-            info(vault_path=vault_path)
+        info(vault_path=vault_path)
 
-            # Verify empty inbox message
-            mock_print.assert_any_call("\n:inbox_tray: Inbox is empty :sparkles:")
+        # Verify empty inbox message
+        self.mock_print.assert_any_call("\n:inbox_tray: Inbox is empty :sparkles:")
 
-    @patch("sb.load_config")
-    def test_info_integration_many_inbox_files(self, mock_load_config):
+    def test_info_integration_many_inbox_files(self):
         """Integration test for info with many inbox files."""
         vault_path = self.temp_path / "test_vault"
         vault_path.mkdir()
@@ -318,46 +349,39 @@ class TestInfoCommandIntegration(unittest.TestCase):
 
         # Mock config
         mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
-
-        with patch("sb.print") as mock_print:
-            info(vault_path=vault_path)
-
-            # Verify many files message and review suggestion
-            mock_print.assert_any_call("\n:inbox_tray: Inbox has [yellow]12[/yellow] unprocessed notes")
-            mock_print.assert_any_call("\t:light_bulb: [yellow]Consider doing a weekly review![/yellow]")
-
-    @patch("sb.load_config")
-    def test_info_integration_custom_inbox_folder(self, mock_load_config):
-        """Integration test for info with custom inbox folder name."""
+        self.mock_load_config.return_value = mock_config
+
+        info(vault_path=vault_path)
+
+        # Verify many files message and review suggestion
+        self.mock_print.assert_any_call("\n:inbox_tray: Inbox has [yellow]12[/yellow] unprocessed notes")
+        self.mock_print.assert_any_call("\t:light_bulb: [yellow]Consider doing a weekly review![/yellow]")
+
+    @parameterized.expand(
+        [
+            ("0_Inbox",),
+            ("9_CustomInbox",),
+        ]
+    )
+    def test_info_integration_custom_inbox_folder(self, inbox_folder):
+        """Integration test for info with a PARA and a custom inbox folder name."""
         vault_path = self.temp_path / "test_vault"
-        vault_path.mkdir()
-
-        # Create custom inbox folder
-        custom_inbox = "9_CustomInbox"
-        inbox_path = vault_path / custom_inbox
-        inbox_path.mkdir()
+        inbox_path = vault_path / inbox_folder
+        inbox_path.mkdir(parents=True)
+        (vault_path / ".obsidian").mkdir()
 
         for i in range(5):
             note_path = inbox_path / f"note_{i}.md"
             note_path.write_text(f"# Custom Inbox Note {i}")
 
-        # Create .obsidian directory
-        obsidian_dir = vault_path / ".obsidian"
-        obsidian_dir.mkdir()
-
-        # Mock config with custom inbox
-        mock_config = Config(vault_path=vault_path, inbox_folder=custom_inbox)
-        mock_load_config.return_value = mock_config
+        self.mock_load_config.return_value = Config(vault_path=vault_path, inbox_folder=inbox_folder)
 
-        with patch("sb.print") as mock_print:
-            info(vault_path=vault_path)
+        info(vault_path=vault_path)
 
-            # Verify custom inbox is used
-            mock_print.assert_any_call("\n:inbox_tray: Inbox has [yellow]5[/yellow] unprocessed notes")
+        # Verify the configured inbox is used
+        self.mock_print.assert_any_call("\n:inbox_tray: Inbox has [yellow]5[/yellow] unprocessed notes")
 
-    @patch("sb.load_config")
-    def test_info_integration_missing_obsidian(self, mock_load_config):
+    def test_info_integration_missing_obsidian(self):
         """Integration test for info with vault missing .obsidian directory."""
         vault_path = self.temp_path / "test_vault"
         vault_path.mkdir()
@@ -369,33 +393,27 @@ class TestInfoCommandIntegration(unittest.TestCase):
             folder_path.mkdir()
 
         # Mock config - this should fail validation
-        mock_config = Config(vault_path=vault_path, inbox_folder="0_Inbox")
-        mock_load_config.return_value = mock_config
-
         # The load_config function should raise InvalidVaultError when .obsidian is missing
-        with patch("sb.load_config") as mock_load:
-            from config import InvalidVaultError
+        self.mock_load_config.side_effect = InvalidVaultError(f"'{vault_path}' is not a valid Obsidian vault.")
 
-            mock_load.side_effect = InvalidVaultError(f"'{vault_path}' is not a valid Obsidian vault.")
-
-            with patch("sb.print") as mock_print:
-                with self.assertRaises(typer.Exit):
-                    info(vault_path=vault_path)
+        with self.assertRaises(typer.Exit):
+            info(vault_path=vault_path)
 
-                mock_print.assert_any_call(
-                    ":cross_mark: [bold red]'{}' is not a valid Obsidian vault.[/bold red]".format(vault_path)
-                )
+        self.mock_print.assert_any_call(
+            ":cross_mark: [bold red]'{}' is not a valid Obsidian vault.[/bold red]".format(vault_path)
+        )
 
 
 class TestCommandLineInterface(unittest.TestCase):
     """Tests for command-line interface integration."""
 
-    def setUp(self):
-        """Set up CLI runner."""
-        self.runner = CliRunner()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a CLI runner shared by the tests."""
+        cls.runner = CliRunner()
 
     @patch("sb.load_config")
-    @patch("sb.git.Repo")
+    @patch("git.Repo")
     def test_cli_sync_command(self, mock_repo_class, mock_load_config):
         """Test that CLI sync command can be invoked via the CLI interface."""
         mock_config = Config(vault_path=Path("/test/vault"), inbox_folder="0_Inbox")
@@ -404,7 +422,7 @@ class TestCommandLineInterface(unittest.TestCase):
         mock_repo = MagicMock()
         mock_repo_class.return_value = mock_repo
         mock_repo.active_branch.name = "master"
-        mock_repo.is_dirty.return_value = False
+        mock_repo.git.status.return_value = ""
 
         mock_origin = MagicMock()
         mock_repo.remote.return_value = mock_origin
@@ -414,18 +432,19 @@ class TestCommandLineInterface(unittest.TestCase):
         self.assertEqual(result.exit_code, 0)
         mock_load_config.assert_called_once()
 
+    @patch("sb._scan_md", return_value=0)
+    @patch("sb._count_md", return_value=(0, 0))
     @patch("sb.load_config")
-    def test_cli_info_command(self, mock_load_config):
+    def test_cli_info_command(self, mock_load_config, mock_count_md, mock_scan_md):
         """Test that CLI info command can be invoked via the CLI interface."""
-        mock_vault_path = MagicMock(spec=Path)
+        mock_vault_path = MagicMock()
         mock_config = Config(inbox_folder="0_Inbox")
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_folder = MagicMock(spec=Path)
+        mock_folder = MagicMock()
         mock_folder.exists.return_value = True
         mock_folder.is_dir.return_value = True
-        mock_folder.glob.return_value = []
         mock_vault_path.__truediv__.return_value = mock_folder
 
         result = self.runner.invoke(app, ["info"])
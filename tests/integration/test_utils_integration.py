@@ -7,11 +7,20 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-import pytest
+from parameterized import parameterized
 
 # Import the functions to test
-from utils import daily_exists, find_vault_root, format_hashtags, sanitize_filename
+from utils import (
+    _find_vault_root_from,
+    append_to_note,
+    daily_exists,
+    find_vault_root,
+    format_hashtags,
+    sanitize_filename,
+    write_note,
+)
 
 
 class TestDailyExistsIntegration(unittest.TestCase):
@@ -53,6 +62,10 @@ class TestDailyExistsIntegration(unittest.TestCase):
 class TestFindVaultRootIntegration(unittest.TestCase):
     """Integration tests for find_vault_root function with real directory structure."""
 
+    def setUp(self):
+        """Start each test with an empty vault root cache."""
+        _find_vault_root_from.cache_clear()
+
     def test_find_vault_root_in_parent_directory(self):
         """Test finding vault in parent directory with real filesystem."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -66,17 +79,11 @@ class TestFindVaultRootIntegration(unittest.TestCase):
             deep_sub_dir = sub_dir / "deep_subfolder"
             deep_sub_dir.mkdir()
 
-            # Change to deep subdirectory and search for vault
-            original_cwd = os.getcwd()
-            os.chdir(deep_sub_dir)
+            # Search for the vault from the deep subdirectory
+            result = find_vault_root("test_vault", start=deep_sub_dir)
 
-            try:
-                result = find_vault_root("test_vault")
-
-                self.assertIsNotNone(result)
-                self.assertEqual(result, vault_dir)
-            finally:
-                os.chdir(original_cwd)
+            self.assertIsNotNone(result)
+            self.assertEqual(result, vault_dir)
 
     def test_find_vault_root_when_already_in_vault(self):
         """Test finding vault when already inside it with real filesystem."""
@@ -88,16 +95,10 @@ class TestFindVaultRootIntegration(unittest.TestCase):
             sub_dir = vault_dir / "subfolder"
             sub_dir.mkdir()
 
-            original_cwd = os.getcwd()
-            os.chdir(sub_dir)
-
-            try:
-                result = find_vault_root("my_vault")
+            result = find_vault_root("my_vault", start=sub_dir)
 
-                self.assertIsNotNone(result)
-                self.assertEqual(result, vault_dir)
-            finally:
-                os.chdir(original_cwd)
+            self.assertIsNotNone(result)
+            self.assertEqual(result, vault_dir)
 
     def test_find_vault_root_not_found(self):
         """Test when vault is not found with real filesystem."""
@@ -106,15 +107,9 @@ class TestFindVaultRootIntegration(unittest.TestCase):
             some_dir = temp_path / "some_directory"
             some_dir.mkdir()
 
-            original_cwd = os.getcwd()
-            os.chdir(some_dir)
+            result = find_vault_root("nonexistent_vault", start=some_dir)
 
-            try:
-                result = find_vault_root("nonexistent_vault")
-
-                self.assertIsNone(result)
-            finally:
-                os.chdir(original_cwd)
+            self.assertIsNone(result)
 
     def test_find_vault_root_with_similar_names(self):
         """Test vault finding with similar directory names."""
@@ -128,54 +123,58 @@ class TestFindVaultRootIntegration(unittest.TestCase):
             similar_vault = temp_path / "my_vault_backup"
             similar_vault.mkdir()
 
-            original_cwd = os.getcwd()
-            os.chdir(temp_path)
+            result_correct = find_vault_root("my_vault", start=temp_path)
+            result_similar = find_vault_root("my_vault_backup", start=temp_path)
 
-            try:
-                result_correct = find_vault_root("my_vault")
-                result_similar = find_vault_root("my_vault_backup")
+            self.assertEqual(result_correct, correct_vault)
+            self.assertEqual(result_similar, similar_vault)
 
-                self.assertEqual(result_correct, correct_vault)
-                self.assertEqual(result_similar, similar_vault)
-            finally:
-                os.chdir(original_cwd)
+    def test_find_vault_root_defaults_to_current_directory(self):
+        """Test that the search starts from the current working directory by default."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vault_dir = Path(temp_dir) / "my_vault"
+            sub_dir = vault_dir / "subfolder"
+            sub_dir.mkdir(parents=True)
+
+            self.addCleanup(os.chdir, os.getcwd())
+            os.chdir(sub_dir)
+
+            self.assertEqual(find_vault_root("my_vault"), vault_dir)
 
 
 class TestSanitizeFilenameIntegration(unittest.TestCase):
     """Integration tests for sanitize_filename function with filesystem validation."""
 
-    def test_sanitized_filenames_are_filesystem_safe(self):
+    @classmethod
+    def setUpClass(cls):
+        """Set up one temporary directory shared by the filesystem safety cases."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.temp_path = Path(cls.temp_dir.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls.temp_dir.cleanup()
+
+    @parameterized.expand(
+        [
+            ("Normal File Name",),
+            ("File@With#Special$Chars",),
+            ("File With  Multiple   Spaces",),
+            ("File-With--Multiple___Underscores",),
+            ("UPPERCASE LOWERCASE MixedCase",),
+            ("File123 With456 Numbers789",),
+        ]
+    )
+    def test_sanitized_filenames_are_filesystem_safe(self, title):
         """Test that sanitized filenames can be safely used in filesystem."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            test_cases = [
-                "Normal File Name",
-                "File@With#Special$Chars",
-                "File With  Multiple   Spaces",
-                "File-With--Multiple___Underscores",
-                "UPPERCASE LOWERCASE MixedCase",
-                "File123 With456 Numbers789",
-            ]
-
-            for title in test_cases:
-                sanitized = sanitize_filename(title)
-
-                # Create file with sanitized name
-                file_path = temp_path / f"{sanitized}.md"
+        sanitized = sanitize_filename(title)
 
-                try:
-                    # Write and read to verify filesystem compatibility
-                    file_path.write_text(f"# {title}")
-                    content = file_path.read_text()
+        # Creating the file proves the name is accepted by the filesystem
+        file_path = self.temp_path / f"{sanitized}.md"
+        file_path.touch()
 
-                    self.assertTrue(file_path.exists())
-                    self.assertEqual(content, f"# {title}")
-                    # Clean up for next iteration
-                    file_path.unlink()
-
-                except (OSError, IOError) as e:
-                    pytest.fail(f"Filename '{sanitized}' is not filesystem safe: {e}")
+        self.assertTrue(file_path.is_file())
 
     def test_sanitized_filenames_are_unique(self):
         """Test that similar titles produce unique sanitized filenames."""
@@ -229,36 +228,102 @@ class TestFormatHashtagsIntegration(unittest.TestCase):
                 self.assertTrue(note_content.endswith("Tags: "))
 
     def test_hashtags_with_file_creation(self):
-        """Test that formatted hashtags work well in actual file content."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            hashtag_inputs = [
-                "python, automation, testing",
-                "project-alpha, milestone-1",
-                "urgent, important, follow-up",
-            ]
+        """Test that formatted hashtags work well in note content."""
+        hashtag_inputs = [
+            "python, automation, testing",
+            "project-alpha, milestone-1",
+            "urgent, important, follow-up",
+        ]
 
-            for i, tags in enumerate(hashtag_inputs):
-                formatted_tags = format_hashtags(tags)
+        for i, tags in enumerate(hashtag_inputs):
+            formatted_tags = format_hashtags(tags)
 
-                # Create a note file with these tags
-                filename = temp_path / f"test_note_{i}.md"
-                content = f"""# Test Note {i}
+            # Build note content with these tags
+            content = f"""# Test Note {i}
 
 This is a test note with formatted hashtags.
 
 **Tags**: {formatted_tags}
 """
-                filename.write_text(content)
 
-                # Read back and verify
-                read_content = filename.read_text()
+            self.assertIn(formatted_tags, content)
+            if formatted_tags:  # Only check if there are tags
+                self.assertTrue(content.strip().endswith(formatted_tags))
+
+
+class TestWriteNoteIntegration(unittest.TestCase):
+    """Integration tests for write_note function with real filesystem."""
+
+    def test_write_note_creates_file(self):
+        """Test write_note writes the full content to a new file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note_path = Path(temp_dir) / "note.md"
+            content = "# Note ✅\n\n" + "line\n" * 10000
+
+            write_note(note_path, content)
+
+            self.assertEqual(note_path.read_text(encoding="utf-8"), content)
+
+    def test_write_note_creates_missing_parents(self):
+        """Test write_note creates missing parent directories."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note_path = Path(temp_dir) / "2_Areas" / "Journal" / "note.md"
+
+            write_note(note_path, "content")
+
+            self.assertEqual(note_path.read_text(), "content")
+
+    def test_write_note_refuses_existing_file(self):
+        """Test write_note never overwrites an existing note."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note_path = Path(temp_dir) / "note.md"
+            note_path.write_text("original")
+
+            with self.assertRaises(FileExistsError):
+                write_note(note_path, "replacement")
+
+            self.assertEqual(note_path.read_text(), "original")
+
+
+class TestAppendToNoteIntegration(unittest.TestCase):
+    """Integration tests for append_to_note function with real filesystem."""
+
+    def test_append_to_note_keeps_existing_content(self):
+        """Test append_to_note adds text after the existing content."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note_path = Path(temp_dir) / "daily.md"
+            note_path.write_text("# Daily\n")
+
+            append_to_note(note_path, "[[first.md]]")
+            append_to_note(note_path, "[[second.md]]")
+
+            self.assertEqual(note_path.read_text(), "# Daily\n[[first.md]][[second.md]]")
+
+    def test_append_to_note_creates_missing_file(self):
+        """Test append_to_note creates the note when it does not exist."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note_path = Path(temp_dir) / "daily.md"
+
+            append_to_note(note_path, "[[note.md]]")
+
+            self.assertEqual(note_path.read_text(), "[[note.md]]")
+
+    def test_append_to_note_retries_short_writes(self):
+        """Test append_to_note keeps writing until the whole text is appended."""
+        real_write = os.write
+
+        def one_byte_write(fd, data):
+            return real_write(fd, data[:1])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            note_path = Path(temp_dir) / "daily.md"
+            note_path.write_text("# Daily\n")
+
+            with patch("utils.os.write", side_effect=one_byte_write) as mock_write:
+                append_to_note(note_path, "[[note.md]]")
 
-                self.assertIn(formatted_tags, read_content)
-                if formatted_tags:  # Only check if there are tags
-                    self.assertTrue(read_content.strip().endswith(formatted_tags))
-                    assert read_content.strip().endswith(formatted_tags)
+            self.assertEqual(note_path.read_text(), "# Daily\n[[note.md]]")
+            self.assertEqual(mock_write.call_count, len("[[note.md]]"))
 
 
 class TestComponentIntegration(unittest.TestCase):
@@ -359,6 +424,6 @@ class TestEdgeCasesIntegration(unittest.TestCase):
         formatted = format_hashtags(unicode_hashtags)
 
         # Note: The current implementation removes non-ASCII characters
-        # This is expected behavior based on the regex pattern [^a-zA-Z0-9\-_]
+        # This is expected behavior, only [a-zA-Z0-9-_] are kept
         self.assertEqual(sanitized, "caf_meeting_with_nave_participants")
         self.assertEqual(formatted, "#café #naïve #🚀")
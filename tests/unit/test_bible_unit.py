@@ -105,10 +105,12 @@ class TestIsValidChapter(unittest.TestCase):
         """Test chapter 23 for Revelation is invalid."""
         self.assertFalse(_is_valid_chapter("Revelation", 23))
 
-    def test_valid_chapter_exact_case(self):
-        """Test chapter validation uses exact case matching for book names."""
+    def test_valid_chapter_case_insensitive(self):
+        """Test chapter validation matches book names regardless of case."""
         self.assertTrue(_is_valid_chapter("Genesis", 1))
-        self.assertFalse(_is_valid_chapter("genesis", 1))  # Case-sensitive dict lookup
+        self.assertTrue(_is_valid_chapter("genesis", 1))
+        self.assertTrue(_is_valid_chapter("GENESIS", 50))
+        self.assertFalse(_is_valid_chapter("genesis", 51))
 
     def test_obadiah_single_chapter(self):
         """Test Obadiah which has only 1 chapter."""
@@ -463,44 +465,44 @@ class TestGetLinks(unittest.TestCase):
         prev, nxt, misc = _get_links("Genesis", 1)
         self.assertEqual(prev, "N/A")  # No previous for first chapter of Bible
         self.assertEqual(nxt, "[[genesis_2]]")
-        self.assertIn("the_bible", misc)
-        self.assertIn("old_testament", misc)
-        self.assertIn("pentateuch", misc)
+        self.assertIn("[[the_bible]]", misc)
+        self.assertIn("[[old_testament]]", misc)
+        self.assertIn("[[pentateuch]]", misc)
 
     def test_revelation_chapter_22_links(self):
         """Test links for Revelation chapter 22 (last chapter of Bible)."""
         prev, nxt, misc = _get_links("Revelation", 22)
         self.assertEqual(prev, "[[revelation_21]]")
         self.assertEqual(nxt, "N/A")
-        self.assertIn("the_bible", misc)
-        self.assertIn("new_testament", misc)
-        self.assertIn("prophetic_books", misc)
+        self.assertIn("[[the_bible]]", misc)
+        self.assertIn("[[new_testament]]", misc)
+        self.assertIn("[[prophetic_books]]", misc)
 
     def test_matthew_chapter_links(self):
         """Test links for Matthew (gospel, synoptic)."""
         prev, nxt, misc = _get_links("Matthew", 1)
-        self.assertIn("gospels", misc)
-        self.assertIn("synoptic_gospels", misc)
-        self.assertIn("historical_books", misc)
-        self.assertIn("new_testament", misc)
+        self.assertIn("[[gospels]]", misc)
+        self.assertIn("[[synoptic_gospels]]", misc)
+        self.assertIn("[[historical_books]]", misc)
+        self.assertIn("[[new_testament]]", misc)
 
     def test_john_chapter_links(self):
         """Test links for John (gospel but not synoptic)."""
         prev, nxt, misc = _get_links("John", 1)
-        self.assertIn("gospels", misc)
-        self.assertNotIn("synoptic_gospels", misc)
+        self.assertIn("[[gospels]]", misc)
+        self.assertNotIn("[[synoptic_gospels]]", misc)
 
     def test_romans_chapter_links(self):
         """Test links for Romans (Pauline letter)."""
         prev, nxt, misc = _get_links("Romans", 1)
-        self.assertIn("pauline_letters", misc)
-        self.assertIn("letters", misc)
+        self.assertIn("[[pauline_letters]]", misc)
+        self.assertIn("[[letters]]", misc)
 
     def test_psalms_chapter_links(self):
         """Test links for Psalms (poetry)."""
         prev, nxt, misc = _get_links("Psalms", 1)
-        self.assertIn("poetic_books", misc)
-        self.assertIn("old_testament", misc)
+        self.assertIn("[[poetic_books]]", misc)
+        self.assertIn("[[old_testament]]", misc)
 
 
 class TestChapterCommand(unittest.TestCase):
@@ -554,13 +556,9 @@ class TestChapterCommand(unittest.TestCase):
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_bible_path = MagicMock(spec=Path)
-        mock_vault_path.__truediv__.return_value = mock_bible_path
-        mock_bible_path.__truediv__.return_value = mock_bible_path
-
         mock_note_path = MagicMock(spec=Path)
         mock_note_path.exists.return_value = True
-        mock_bible_path.__truediv__.return_value = mock_note_path
+        mock_vault_path.__truediv__.return_value = mock_note_path
 
         with patch("bible.print"):
             with self.assertRaises(typer.Exit) as cm:
@@ -577,9 +575,11 @@ class TestChapterCommand(unittest.TestCase):
 
         self.assertEqual(cm.exception.exit_code, 0)
 
+    @patch("bible.append_to_note")
+    @patch("bible.write_note")
     @patch("bible.load_config")
     @patch("bible.daily_exists")
-    def test_chapter_successful_creation(self, mock_daily_exists, mock_load_config):
+    def test_chapter_successful_creation(self, mock_daily_exists, mock_load_config, mock_write_note, mock_append):
         """Test successful chapter note creation."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
@@ -587,30 +587,13 @@ class TestChapterCommand(unittest.TestCase):
         mock_load_config.return_value = mock_config
 
         # Set up path mocks
-        mock_bible_base = MagicMock(spec=Path)
-        mock_bible_book_path = MagicMock(spec=Path)
-
         mock_note_path = MagicMock(spec=Path)
         mock_note_path.exists.return_value = False
         mock_note_path.__str__ = lambda s: "genesis_01.md"
 
         mock_daily_exists.return_value = True  # Daily note already exists
 
-        def vault_truediv(key):
-            if "1_Projects" in str(key):
-                return mock_bible_base
-            return mock_bible_base
-
-        mock_vault_path.__truediv__ = MagicMock(side_effect=lambda k: mock_bible_base)
-        mock_bible_base.__truediv__ = MagicMock(side_effect=lambda k: mock_bible_book_path)
-        mock_bible_book_path.__truediv__ = MagicMock(side_effect=lambda k: mock_note_path)
-        mock_note_path.open = MagicMock(return_value=MagicMock(__enter__=MagicMock(), __exit__=MagicMock()))
-        mock_note_path.relative_to = MagicMock(return_value=Path("1_Projects/Bible-Study/Genesis/genesis_01.md"))
-
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_note_path.open = MagicMock(return_value=mock_file)
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("bible.print") as mock_print:
             ctx = MagicMock()
@@ -627,6 +610,10 @@ class TestChapterCommand(unittest.TestCase):
         mock_print.assert_called_with(
             ":white_check_mark: [green]Bible chapter summary created:[/green] 1_Projects/Bible-Study/Genesis/genesis_01.md"
         )
+        mock_write_note.assert_called_once()
+        self.assertIs(mock_write_note.call_args[0][0], mock_note_path)
+        mock_append.assert_called_once()
+        self.assertEqual(mock_append.call_args[0][1], "[[genesis_01.md]]")
 
 
 class TestAppConfiguration(unittest.TestCase):
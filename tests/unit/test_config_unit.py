@@ -3,17 +3,26 @@ Unit tests for config.py module.
 Mock all external dependencies to test functions in isolation.
 """
 
+import io
 import os
+import stat
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-import yaml
-
 from config import INBOX_FOLDER, VAULT_NAME, Config, InvalidVaultError, load_config
 
 
+def make_vault_mock(obsidian_exists=True, spec=None):
+    """Build a mock vault directory whose `.obsidian` child exists (or not)."""
+    vault_path = MagicMock(spec=spec)
+    vault_path.expanduser.return_value = vault_path
+    vault_path.stat.return_value.st_mode = stat.S_IFDIR
+    vault_path.__truediv__.return_value.exists.return_value = obsidian_exists
+    return vault_path
+
+
 class TestConfigModel(unittest.TestCase):
     """Unit tests for Config class."""
 
@@ -50,124 +59,123 @@ class TestConfigLoadMethod(unittest.TestCase):
 
     def test_load_valid_yaml_file(self):
         """Test loading from valid YAML configuration file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("vault_path: /test/vault\ninbox_folder: 1_CustomInbox\n")
-            temp_path = f.name
-
-        try:
-            result = Config.load(temp_path)
-            self.assertIsInstance(result, Config)
-            self.assertEqual(result.vault_path, Path("/test/vault"))
-            self.assertEqual(result.inbox_folder, "1_CustomInbox")
-        finally:
-            os.unlink(temp_path)
+        result = Config.load(io.BytesIO(b"vault_path: /test/vault\ninbox_folder: 1_CustomInbox\n"))
+
+        self.assertIsInstance(result, Config)
+        self.assertEqual(result.vault_path, Path("/test/vault"))
+        self.assertEqual(result.inbox_folder, "1_CustomInbox")
 
     def test_load_invalid_yaml_file(self):
         """Test loading from invalid YAML file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("invalid: yaml: content:\n  - broken\n- yaml")
-            temp_path = f.name
-
-        try:
-            # pydantic_yaml will raise an exception for invalid YAML
-            with self.assertRaises(Exception):
-                Config.load(temp_path)
-        finally:
-            os.unlink(temp_path)
+        # PyYAML will raise an exception for invalid YAML
+        with self.assertRaises(Exception):
+            Config.load(io.BytesIO(b"invalid: yaml: content:\n  - broken\n- yaml"))
 
     def test_load_partial_config(self):
         """Test loading YAML with partial configuration."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("inbox_folder: 0_CustomInbox\n")
-            temp_path = f.name
+        result = Config.load(io.BytesIO(b"inbox_folder: 0_CustomInbox\n"))
+
+        self.assertIsInstance(result, Config)
+        self.assertIsNone(result.vault_path)  # Not specified in YAML
+        self.assertEqual(result.inbox_folder, "0_CustomInbox")
+
+    def test_load_empty_file(self):
+        """Test loading an empty YAML file falls back to default values."""
+        result = Config.load(io.BytesIO(b""))
+
+        self.assertIsInstance(result, Config)
+        self.assertIsNone(result.vault_path)
+        self.assertEqual(result.inbox_folder, INBOX_FOLDER)
+
+    def test_load_non_mapping_file(self):
+        """Test loading a YAML file whose top level is not a mapping."""
+        with self.assertRaises(ValueError):
+            Config.load(io.BytesIO(b"- vault_path\n- inbox_folder\n"))
+
+    def test_load_null_inbox_folder(self):
+        """Test that an empty inbox_folder setting falls back to the default."""
+        result = Config.load(io.BytesIO(b"inbox_folder:\n"))
+
+        self.assertEqual(result.inbox_folder, INBOX_FOLDER)
+
+    def test_load_non_string_vault_path(self):
+        """Test that a vault_path that is not a string is rejected."""
+        with self.assertRaises(ValueError) as context:
+            Config.load(io.BytesIO(b"vault_path: 42\n"))
+
+        self.assertIn("vault_path", str(context.exception))
+
+    def test_load_non_string_inbox_folder(self):
+        """Test that an inbox_folder that is not a string is rejected."""
+        with self.assertRaises(ValueError) as context:
+            Config.load(io.BytesIO(b"inbox_folder: [0_Inbox]\n"))
+
+        self.assertIn("inbox_folder", str(context.exception))
 
-        try:
-            result = Config.load(temp_path)
-            self.assertIsInstance(result, Config)
-            self.assertIsNone(result.vault_path)  # Not specified in YAML
-            self.assertEqual(result.inbox_folder, "0_CustomInbox")
-        finally:
-            os.unlink(temp_path)
+    def test_load_text_stream(self):
+        """Test loading from a text file object."""
+        result = Config.load(io.StringIO("inbox_folder: 0_CustomInbox\n"))
+
+        self.assertIsInstance(result, Config)
+        self.assertEqual(result.inbox_folder, "0_CustomInbox")
 
 
 class TestLoadConfig(unittest.TestCase):
     """Unit tests for load_config function with mocked dependencies."""
 
-    @patch("config.Config.load")
-    @patch("config.find_vault_root")
-    def test_load_config_no_file_no_cli_vault(self, mock_find_vault, mock_config_load):
-        """Test load_config when no config file and no CLI vault path."""
-        mock_config_load.return_value = None  # No config file
+    def setUp(self):
+        """Clear the load_config cache and patch the config loader and vault search."""
+        load_config.cache_clear()
 
-        mock_vault_path = MagicMock(spec=Path)
-        mock_vault_path.expanduser.return_value = mock_vault_path
-        mock_vault_path.exists.return_value = True
-        mock_vault_path.is_dir.return_value = True
+        config_load_patcher = patch("config.Config.load")
+        self.mock_config_load = config_load_patcher.start()
+        self.addCleanup(config_load_patcher.stop)
 
-        mock_obsidian_path = MagicMock(spec=Path)
-        mock_obsidian_path.exists.return_value = True
-        mock_vault_path.__truediv__.return_value = mock_obsidian_path
+        find_vault_patcher = patch("config.find_vault_root")
+        self.mock_find_vault = find_vault_patcher.start()
+        self.addCleanup(find_vault_patcher.stop)
 
-        mock_find_vault.return_value = mock_vault_path
+    def test_load_config_no_file_no_cli_vault(self):
+        """Test load_config when no config file and no CLI vault path."""
+        self.mock_config_load.return_value = None  # No config file
+
+        mock_vault_path = make_vault_mock()
+        self.mock_find_vault.return_value = mock_vault_path
 
         config_file = Path("/nonexistent/config.yaml")
         result = load_config(config_file, vault_path=None)
 
-        mock_config_load.assert_called_once_with(config_file.expanduser())
-        mock_find_vault.assert_called_once_with(VAULT_NAME)
+        self.mock_config_load.assert_called_once_with(os.path.expanduser(config_file))
+        self.mock_find_vault.assert_called_once_with(VAULT_NAME)
         self.assertEqual(result.vault_path, mock_vault_path)
         self.assertEqual(result.inbox_folder, INBOX_FOLDER)
 
         mock_vault_path.__truediv__.assert_called_with(".obsidian")
 
-    @patch("config.Config.load")
-    @patch("config.find_vault_root")
-    def test_load_config_with_file_no_cli_vault(self, mock_find_vault, mock_config_load):
+    def test_load_config_with_file_no_cli_vault(self):
         """Test load_config with config file but no CLI vault path."""
-        mock_vault_path = MagicMock(spec=Path)
-        mock_vault_path.expanduser.return_value = mock_vault_path
-        mock_vault_path.exists.return_value = True
-        mock_vault_path.is_dir.return_value = True
-
-        mock_obsidian_path = MagicMock(spec=Path)
-        mock_obsidian_path.exists.return_value = True
-        mock_vault_path.__truediv__.return_value = mock_obsidian_path
+        mock_vault_path = make_vault_mock()
 
         mock_config = Config(vault_path=mock_vault_path, inbox_folder="0_Inbox")
-        mock_config_load.return_value = mock_config
+        self.mock_config_load.return_value = mock_config
 
         config_file = Path("/existing/config.yaml")
         result = load_config(config_file, vault_path=None)
 
-        mock_config_load.assert_called_once_with(config_file.expanduser())
-        mock_find_vault.assert_not_called()  # Should not be called when vault_path is in config
+        self.mock_config_load.assert_called_once_with(os.path.expanduser(config_file))
+        self.mock_find_vault.assert_not_called()  # Should not be called when vault_path is in config
         self.assertEqual(result.vault_path, mock_vault_path)
         self.assertEqual(result.inbox_folder, "0_Inbox")
 
         mock_vault_path.__truediv__.assert_called_with(".obsidian")
 
-    @patch("config.Config.load")
-    @patch("config.find_vault_root")
-    def test_load_config_cli_vault_override(self, mock_find_vault, mock_config_load):
+    def test_load_config_cli_vault_override(self):
         """Test that CLI vault path overrides config file vault path."""
-        mock_config_vault_path = MagicMock(spec=Path)
-        mock_config_vault_path.expanduser.return_value = mock_config_vault_path
-        mock_config_vault_path.exists.return_value = True
-        mock_config_vault_path.is_dir.return_value = True
-        mock_config_obsidian = MagicMock(spec=Path)
-        mock_config_obsidian.exists.return_value = True
-        mock_config_vault_path.__truediv__.return_value = mock_config_obsidian
-
-        mock_cli_vault_path = MagicMock(spec=Path)
-        mock_cli_vault_path.expanduser.return_value = mock_cli_vault_path
-        mock_cli_vault_path.exists.return_value = True
-        mock_cli_vault_path.is_dir.return_value = True
-        mock_cli_obsidian = MagicMock(spec=Path)
-        mock_cli_obsidian.exists.return_value = True
-        mock_cli_vault_path.__truediv__.return_value = mock_cli_obsidian
+        mock_config_vault_path = make_vault_mock()
+        mock_cli_vault_path = make_vault_mock(spec=Path)  # Keep one Path-specced mock to catch API drift
 
         mock_config = Config(vault_path=mock_config_vault_path, inbox_folder="0_Inbox")
-        mock_config_load.return_value = mock_config
+        self.mock_config_load.return_value = mock_config
 
         config_file = Path("/existing/config.yaml")
 
@@ -178,12 +186,22 @@ class TestLoadConfig(unittest.TestCase):
 
         mock_cli_vault_path.__truediv__.assert_called_with(".obsidian")
 
-    @patch("config.Config.load")
-    @patch("config.find_vault_root")
-    def test_load_config_no_vault_found(self, mock_find_vault, mock_config_load):
+    def test_load_config_cli_vault_skips_vault_search(self):
+        """Test that the vault search is skipped when a CLI vault path is given."""
+        mock_cli_vault_path = make_vault_mock()
+
+        self.mock_config_load.return_value = None  # No config file
+
+        result = load_config(Path("/nonexistent/config.yaml"), vault_path=mock_cli_vault_path)
+
+        self.mock_find_vault.assert_not_called()
+        self.assertEqual(result.vault_path, mock_cli_vault_path)
+        self.assertEqual(result.inbox_folder, INBOX_FOLDER)
+
+    def test_load_config_no_vault_found(self):
         """Test load_config when no vault can be found."""
-        mock_config_load.return_value = None  # No config file
-        mock_find_vault.return_value = None  # No vault found
+        self.mock_config_load.return_value = None  # No config file
+        self.mock_find_vault.return_value = None  # No vault found
 
         config_file = Path("/nonexistent/config.yaml")
 
@@ -192,35 +210,24 @@ class TestLoadConfig(unittest.TestCase):
 
         self.assertIn("No second-brain vault found.", str(context.exception))
 
-    @patch("config.Config.load")
-    @patch("config.find_vault_root")
-    def test_load_config_invalid_vault_path(self, mock_find_vault, mock_config_load):
+    def test_load_config_invalid_vault_path(self):
         """Test load_config with invalid vault path."""
         invalid_vault = Path("/invalid/vault")
-        mock_config_load.return_value = Config(vault_path=invalid_vault)
+        self.mock_config_load.return_value = Config(vault_path=invalid_vault)
 
         config_file = Path("/config.yaml")
 
-        with patch.object(Path, "exists", return_value=False):
+        with patch.object(Path, "stat", side_effect=FileNotFoundError):
             with self.assertRaises(InvalidVaultError) as context:
                 load_config(config_file, vault_path=None)
 
         self.assertIn(f"Invalid vault path: {invalid_vault}", str(context.exception))
 
-    @patch("config.Config.load")
-    @patch("config.find_vault_root")
-    def test_load_config_non_obsidian_vault(self, mock_find_vault, mock_config_load):
+    def test_load_config_non_obsidian_vault(self):
         """Test load_config with vault that lacks .obsidian directory."""
-        mock_vault_path = MagicMock(spec=Path)
-        mock_vault_path.expanduser.return_value = mock_vault_path
-        mock_vault_path.exists.return_value = True
-        mock_vault_path.is_dir.return_value = True
+        mock_vault_path = make_vault_mock(obsidian_exists=False)  # Simulate missing .obsidian
 
-        mock_obsidian_path = MagicMock(spec=Path)
-        mock_obsidian_path.exists.return_value = False  # Simulate missing .obsidian
-        mock_vault_path.__truediv__.return_value = mock_obsidian_path
-
-        mock_config_load.return_value = Config(vault_path=mock_vault_path)
+        self.mock_config_load.return_value = Config(vault_path=mock_vault_path)
         config_file = Path("/config.yaml")
 
         with self.assertRaises(InvalidVaultError) as context:
@@ -230,30 +237,37 @@ class TestLoadConfig(unittest.TestCase):
 
         mock_vault_path.__truediv__.assert_called_with(".obsidian")
 
-    @patch("config.Config.load")
-    @patch("config.find_vault_root")
-    def test_load_config_path_expansion(self, mock_find_vault, mock_config_load):
+    def test_load_config_path_expansion(self):
         """Test that user home expansion is applied to vault path."""
-        mock_config_load.return_value = Config(vault_path=Path("~/test_vault"))
-        mock_find_vault.return_value = None
+        self.mock_config_load.return_value = Config(vault_path=Path("~/test_vault"))
+        expanded_vault = Path("/home/user/test_vault")
 
         config_file = Path("~/config.yaml")
 
-        with patch.object(Path, "expanduser") as mock_expand:
-            mock_expand.return_value = Path("/home/user/test_vault")
+        with (
+            patch.object(Path, "expanduser", return_value=expanded_vault) as mock_expand,
+            patch.object(Path, "stat") as mock_stat,
+            patch.object(Path, "exists", return_value=True),
+        ):
+            mock_stat.return_value.st_mode = stat.S_IFDIR
+
+            result = load_config(config_file, vault_path=None)
+
+        mock_expand.assert_called_once_with()
+        self.assertEqual(result.vault_path, expanded_vault)
+
+    def test_load_config_is_cached(self):
+        """Test that repeated calls with the same arguments reuse the loaded config."""
+        mock_vault_path = make_vault_mock()
+
+        self.mock_config_load.return_value = Config(vault_path=mock_vault_path)
+        config_file = Path("/existing/config.yaml")
 
-            with (
-                patch.object(Path, "exists", return_value=True),
-                patch.object(Path, "is_dir", return_value=True),
-                patch("pathlib.Path.__truediv__") as mock_div,
-            ):
-                mock_div.return_value.exists.return_value = True
+        first = load_config(config_file, vault_path=None)
+        second = load_config(config_file, vault_path=None)
 
-                try:
-                    load_config(config_file, vault_path=None)
-                    mock_expand.assert_called()
-                except InvalidVaultError:
-                    pass  # We're only testing path expansion
+        self.assertIs(first, second)
+        self.mock_config_load.assert_called_once()
 
 
 class TestInvalidVaultError(unittest.TestCase):
@@ -270,9 +284,7 @@ class TestInvalidVaultError(unittest.TestCase):
         """Test config file that only specifies inbox_folder."""
         with tempfile.TemporaryDirectory() as temp_dir:
             config_path = Path(temp_dir) / "config.yaml"
-            config_data = {"inbox_folder": "9_SpecialInbox"}
-            with open(config_path, "w") as f:
-                yaml.dump(config_data, f)
+            config_path.write_text("inbox_folder: 9_SpecialInbox\n")
 
             result = Config.load(config_path)
             assert result.vault_path is None
@@ -4,6 +4,7 @@ Mock all external dependencies to test functions in isolation.
 """
 
 import unittest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -27,20 +28,18 @@ class TestDailyCommand(unittest.TestCase):
 
         mock_print.assert_called_with(":cross_mark: [bold red]Invalid vault path[/bold red]")
 
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_daily_note_already_exists(self, mock_load_config):
+    def test_daily_note_already_exists(self, mock_load_config, mock_write_note):
         """Test daily command when note already exists."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_daily_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
-        mock_note_path.exists.return_value = True
-        mock_daily_dir.__truediv__ = MagicMock(return_value=mock_note_path)
-        mock_vault_path.__truediv__ = MagicMock(return_value=mock_daily_dir)
-        mock_daily_dir.__truediv__ = MagicMock(return_value=mock_note_path)
+        mock_write_note.side_effect = FileExistsError
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print"):
             with self.assertRaises(typer.Exit) as cm:
@@ -48,26 +47,22 @@ class TestDailyCommand(unittest.TestCase):
 
         self.assertEqual(cm.exception.exit_code, 0)
 
+    @patch("journal.datetime")
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_daily_successful_creation(self, mock_load_config):
+    def test_daily_successful_creation(self, mock_load_config, mock_write_note, mock_datetime):
         """Test successful daily note creation."""
+        mock_datetime.now.return_value = datetime(2024, 1, 15, 9, 30)
+
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_daily_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
         mock_note_path.exists.return_value = False
-        mock_note_path.relative_to = MagicMock(return_value=Path("2_Areas/Journal/Daily/2024-01-15.md"))
-
-        mock_vault_path.__truediv__ = MagicMock(return_value=mock_daily_dir)
-        mock_daily_dir.__truediv__ = MagicMock(return_value=mock_note_path)
 
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_note_path.open = MagicMock(return_value=mock_file)
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print") as mock_print:
             daily(vault_path=None, config_file="~/.sb_config.yml", tags=None)
@@ -76,21 +71,19 @@ class TestDailyCommand(unittest.TestCase):
             ":white_check_mark: [green]Daily journal created:[/green] 2_Areas/Journal/Daily/2024-01-15.md"
         )
 
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_daily_write_error(self, mock_load_config):
+    def test_daily_write_error(self, mock_load_config, mock_write_note):
         """Test daily command when file write fails."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_daily_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
-        mock_note_path.exists.return_value = False
-        mock_note_path.open.side_effect = OSError("Permission denied")
+        mock_write_note.side_effect = OSError("Permission denied")
 
-        mock_vault_path.__truediv__ = MagicMock(return_value=mock_daily_dir)
-        mock_daily_dir.__truediv__ = MagicMock(return_value=mock_note_path)
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print") as mock_print:
             with self.assertRaises(typer.Exit):
@@ -100,36 +93,27 @@ class TestDailyCommand(unittest.TestCase):
             ":cross_mark: [bold red]Failed to create daily journal entry: Permission denied[/bold red]"
         )
 
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_daily_with_tags(self, mock_load_config):
+    def test_daily_with_tags(self, mock_load_config, mock_write_note):
         """Test daily command creates note with tags."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_daily_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
         mock_note_path.exists.return_value = False
-        mock_note_path.relative_to = MagicMock(return_value=Path("2_Areas/Journal/Daily/2024-01-15.md"))
-
-        mock_vault_path.__truediv__ = MagicMock(return_value=mock_daily_dir)
-        mock_daily_dir.__truediv__ = MagicMock(return_value=mock_note_path)
-
-        written_content = []
 
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_file.write = MagicMock(side_effect=lambda s: written_content.append(s))
-        mock_note_path.open = MagicMock(return_value=mock_file)
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print"):
             daily(vault_path=None, config_file="~/.sb_config.yml", tags="test, daily")
 
         # Verify write was called with content
-        mock_file.write.assert_called_once()
-        content = mock_file.write.call_args[0][0]
+        mock_write_note.assert_called_once()
+        note_path, content = mock_write_note.call_args[0]
+        self.assertIs(note_path, mock_note_path)
         self.assertIn("#test #daily", content)
 
 
@@ -147,8 +131,9 @@ class TestWeeklyCommand(unittest.TestCase):
 
         mock_print.assert_called_with(":cross_mark: [bold red]Invalid vault path[/bold red]")
 
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_weekly_note_already_exists(self, mock_load_config):
+    def test_weekly_note_already_exists(self, mock_load_config, mock_write_note):
         """Test weekly command when note already exists."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
@@ -156,20 +141,18 @@ class TestWeeklyCommand(unittest.TestCase):
         mock_config.inbox_folder = "0_Inbox"
         mock_load_config.return_value = mock_config
 
-        mock_weekly_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
-        mock_note_path.exists.return_value = True
+        mock_write_note.side_effect = FileExistsError
 
         mock_inbox_path = MagicMock(spec=Path)
-        mock_inbox_path.exists.return_value = False
+        mock_inbox_path.is_dir.return_value = False
 
         def vault_truediv(key):
             if "Weekly" in str(key):
-                return mock_weekly_dir
+                return mock_note_path
             return mock_inbox_path
 
         mock_vault_path.__truediv__ = MagicMock(side_effect=vault_truediv)
-        mock_weekly_dir.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print"):
             with self.assertRaises(typer.Exit) as cm:
@@ -177,45 +160,43 @@ class TestWeeklyCommand(unittest.TestCase):
 
         self.assertEqual(cm.exception.exit_code, 0)
 
+    @patch("journal.datetime")
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_weekly_successful_creation(self, mock_load_config):
+    def test_weekly_successful_creation(self, mock_load_config, mock_write_note, mock_datetime):
         """Test successful weekly review creation."""
+        mock_datetime.now.return_value = datetime(2024, 1, 15, 9, 30)
+
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_config.inbox_folder = "0_Inbox"
         mock_load_config.return_value = mock_config
 
-        mock_weekly_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
         mock_note_path.exists.return_value = False
-        mock_note_path.relative_to = MagicMock(return_value=Path("2_Areas/Journal/Weekly-Review/01-2024.md"))
 
         mock_inbox_path = MagicMock(spec=Path)
-        mock_inbox_path.exists.return_value = False
+        mock_inbox_path.is_dir.return_value = False
 
         def vault_truediv(key):
             if "Weekly" in str(key) or "Journal" in str(key):
-                return mock_weekly_dir
+                return mock_note_path
             return mock_inbox_path
 
         mock_vault_path.__truediv__ = MagicMock(side_effect=vault_truediv)
-        mock_weekly_dir.__truediv__ = MagicMock(return_value=mock_note_path)
-
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_note_path.open = MagicMock(return_value=mock_file)
 
         with patch("journal.print") as mock_print:
             weekly(vault_path=None, config_file="~/.sb_config.yml", tags=None)
 
         mock_print.assert_called_with(
-            ":white_check_mark: [green]Weekly review created:[/green] 2_Areas/Journal/Weekly-Review/01-2024.md"
+            ":white_check_mark: [green]Weekly review created:[/green] 2_Areas/Journal/Weekly-Review/4-2024.md"
         )
 
+    @patch("journal.os.scandir")
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_weekly_with_inbox_items(self, mock_load_config):
+    def test_weekly_with_inbox_items(self, mock_load_config, mock_write_note, mock_scandir):
         """Test weekly review creation when inbox has items."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
@@ -223,47 +204,72 @@ class TestWeeklyCommand(unittest.TestCase):
         mock_config.inbox_folder = "0_Inbox"
         mock_load_config.return_value = mock_config
 
-        mock_weekly_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
         mock_note_path.exists.return_value = False
-        mock_note_path.relative_to = MagicMock(return_value=Path("2_Areas/Journal/Weekly-Review/01-2024.md"))
 
         mock_inbox_path = MagicMock(spec=Path)
-        mock_inbox_path.exists.return_value = True
         mock_inbox_path.is_dir.return_value = True
-        # Return mock paths with stem attribute for inbox files
-        mock_inbox_item1 = MagicMock(spec=Path)
-        mock_inbox_item1.stem = "note_1"
-        mock_inbox_item2 = MagicMock(spec=Path)
-        mock_inbox_item2.stem = "note_2"
-        mock_inbox_path.glob.return_value = [mock_inbox_item1, mock_inbox_item2]
+        # Return mock directory entries for the inbox listing
+        inbox_entries = []
+        for name, is_file in (("note_1.md", True), ("note_2.md", True), ("image.png", True), ("folder.md", False)):
+            entry = MagicMock()
+            entry.name = name
+            entry.is_file.return_value = is_file
+            inbox_entries.append(entry)
+        mock_scandir.return_value.__enter__.return_value = inbox_entries
 
         def vault_truediv(key):
             if "Weekly" in str(key) or "Journal" in str(key):
-                return mock_weekly_dir
+                return mock_note_path
             return mock_inbox_path
 
         mock_vault_path.__truediv__ = MagicMock(side_effect=vault_truediv)
-        mock_weekly_dir.__truediv__ = MagicMock(return_value=mock_note_path)
-
-        written_content = []
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_file.write = MagicMock(side_effect=lambda s: written_content.append(s))
-        mock_note_path.open = MagicMock(return_value=mock_file)
 
         with patch("journal.print"):
             weekly(vault_path=None, config_file="~/.sb_config.yml", tags=None)
 
         # Verify inbox items appear in content
-        mock_file.write.assert_called_once()
-        content = mock_file.write.call_args[0][0]
-        self.assertIn("note_1", content)
-        self.assertIn("note_2", content)
+        mock_write_note.assert_called_once()
+        content = mock_write_note.call_args[0][1]
+        self.assertIn("- [ ] [[note_1]] → Move to:", content)
+        self.assertIn("- [ ] [[note_2]] → Move to:", content)
+        self.assertNotIn("image", content)
+        self.assertNotIn("[[folder]]", content)
+
+    @patch("journal.os.scandir", side_effect=PermissionError(13, "Permission denied"))
+    @patch("journal.write_note")
+    @patch("journal.load_config")
+    def test_weekly_with_unreadable_inbox(self, mock_load_config, mock_write_note, mock_scandir):
+        """Test weekly review creation when the inbox exists but cannot be read."""
+        mock_config = MagicMock()
+        mock_vault_path = MagicMock(spec=Path)
+        mock_config.vault_path = mock_vault_path
+        mock_config.inbox_folder = "0_Inbox"
+        mock_load_config.return_value = mock_config
+
+        mock_note_path = MagicMock(spec=Path)
+
+        mock_inbox_path = MagicMock(spec=Path)
+        mock_inbox_path.is_dir.return_value = True
 
+        def vault_truediv(key):
+            if "Weekly" in str(key) or "Journal" in str(key):
+                return mock_note_path
+            return mock_inbox_path
+
+        mock_vault_path.__truediv__ = MagicMock(side_effect=vault_truediv)
+
+        with patch("journal.print"):
+            weekly(vault_path=None, config_file="~/.sb_config.yml", tags=None)
+
+        mock_scandir.assert_called_once_with(mock_inbox_path)
+        mock_write_note.assert_called_once()
+        content = mock_write_note.call_args[0][1]
+        self.assertIn("- [ ] No items in inbox.", content)
+
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_weekly_write_error(self, mock_load_config):
+    def test_weekly_write_error(self, mock_load_config, mock_write_note):
         """Test weekly command when file write fails."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
@@ -271,21 +277,18 @@ class TestWeeklyCommand(unittest.TestCase):
         mock_config.inbox_folder = "0_Inbox"
         mock_load_config.return_value = mock_config
 
-        mock_weekly_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
-        mock_note_path.exists.return_value = False
-        mock_note_path.open.side_effect = OSError("Disk full")
+        mock_write_note.side_effect = OSError("Disk full")
 
         mock_inbox_path = MagicMock(spec=Path)
-        mock_inbox_path.exists.return_value = False
+        mock_inbox_path.is_dir.return_value = False
 
         def vault_truediv(key):
             if "Weekly" in str(key) or "Journal" in str(key):
-                return mock_weekly_dir
+                return mock_note_path
             return mock_inbox_path
 
         mock_vault_path.__truediv__ = MagicMock(side_effect=vault_truediv)
-        mock_weekly_dir.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print") as mock_print:
             with self.assertRaises(typer.Exit):
@@ -308,20 +311,19 @@ class TestMonthlyCommand(unittest.TestCase):
 
         mock_print.assert_called_with(":cross_mark: [bold red]Invalid vault path[/bold red]")
 
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_monthly_note_already_exists(self, mock_load_config):
+    def test_monthly_note_already_exists(self, mock_load_config, mock_write_note):
         """Test monthly command when note already exists."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_monthly_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
-        mock_note_path.exists.return_value = True
+        mock_write_note.side_effect = FileExistsError
 
-        mock_vault_path.__truediv__ = MagicMock(return_value=mock_monthly_dir)
-        mock_monthly_dir.__truediv__ = MagicMock(return_value=mock_note_path)
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print"):
             with self.assertRaises(typer.Exit) as cm:
@@ -329,26 +331,22 @@ class TestMonthlyCommand(unittest.TestCase):
 
         self.assertEqual(cm.exception.exit_code, 0)
 
+    @patch("journal.datetime")
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_monthly_successful_creation(self, mock_load_config):
+    def test_monthly_successful_creation(self, mock_load_config, mock_write_note, mock_datetime):
         """Test successful monthly reflection creation."""
+        mock_datetime.now.return_value = datetime(2024, 1, 15, 9, 30)
+
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_monthly_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
         mock_note_path.exists.return_value = False
-        mock_note_path.relative_to = MagicMock(return_value=Path("2_Areas/Journal/Monthly-Reflection/Jan-2024.md"))
-
-        mock_vault_path.__truediv__ = MagicMock(return_value=mock_monthly_dir)
-        mock_monthly_dir.__truediv__ = MagicMock(return_value=mock_note_path)
 
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_note_path.open = MagicMock(return_value=mock_file)
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print") as mock_print:
             monthly(vault_path=None, config_file="~/.sb_config.yml", tags=None)
@@ -357,51 +355,40 @@ class TestMonthlyCommand(unittest.TestCase):
             ":white_check_mark: [green]Monthly reflection created:[/green] 2_Areas/Journal/Monthly-Reflection/Jan-2024.md"
         )
 
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_monthly_with_tags(self, mock_load_config):
+    def test_monthly_with_tags(self, mock_load_config, mock_write_note):
         """Test monthly reflection with custom tags."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_monthly_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
         mock_note_path.exists.return_value = False
-        mock_note_path.relative_to = MagicMock(return_value=Path("2_Areas/Journal/Monthly-Reflection/Jan-2024.md"))
 
-        mock_vault_path.__truediv__ = MagicMock(return_value=mock_monthly_dir)
-        mock_monthly_dir.__truediv__ = MagicMock(return_value=mock_note_path)
-
-        written_content = []
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_file.write = MagicMock(side_effect=lambda s: written_content.append(s))
-        mock_note_path.open = MagicMock(return_value=mock_file)
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print"):
             monthly(vault_path=None, config_file="~/.sb_config.yml", tags="custom, review")
 
-        mock_file.write.assert_called_once()
-        content = mock_file.write.call_args[0][0]
+        mock_write_note.assert_called_once()
+        content = mock_write_note.call_args[0][1]
         self.assertIn("#custom #review", content)
 
+    @patch("journal.write_note")
     @patch("journal.load_config")
-    def test_monthly_write_error(self, mock_load_config):
+    def test_monthly_write_error(self, mock_load_config, mock_write_note):
         """Test monthly command when file write fails."""
         mock_config = MagicMock()
         mock_vault_path = MagicMock(spec=Path)
         mock_config.vault_path = mock_vault_path
         mock_load_config.return_value = mock_config
 
-        mock_monthly_dir = MagicMock(spec=Path)
         mock_note_path = MagicMock(spec=Path)
-        mock_note_path.exists.return_value = False
-        mock_note_path.open.side_effect = OSError("No space left")
+        mock_write_note.side_effect = OSError("No space left")
 
-        mock_vault_path.__truediv__ = MagicMock(return_value=mock_monthly_dir)
-        mock_monthly_dir.__truediv__ = MagicMock(return_value=mock_note_path)
+        mock_vault_path.__truediv__ = MagicMock(return_value=mock_note_path)
 
         with patch("journal.print") as mock_print:
             with self.assertRaises(typer.Exit):
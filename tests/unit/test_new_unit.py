@@ -90,9 +90,8 @@ class TestEmptyCommand(unittest.TestCase):
     )
     def test_empty_command_filename_sanitization(self, input_title, expected):
         """Test various filename sanitization scenarios."""
-        with self.subTest(title=expected):
-            result = sanitize_filename(input_title)
-            self.assertEqual(result, expected)
+        result = sanitize_filename(input_title)
+        self.assertEqual(result, expected)
 
     @parameterized.expand(
         [
@@ -107,9 +106,8 @@ class TestEmptyCommand(unittest.TestCase):
     )
     def test_format_hashtags(self, input_tags, expected):
         """Test hashtag formatting function."""
-        with self.subTest(tags=input_tags):
-            result = format_hashtags(input_tags)
-            self.assertEqual(result, expected)
+        result = format_hashtags(input_tags)
+        self.assertEqual(result, expected)
 
 
 class TestCLIInterface(unittest.TestCase):
@@ -4,273 +4,232 @@ Mock all external dependencies to test functions in isolation.
 """
 
 import unittest
+from contextlib import nullcontext
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import typer
 from git.exc import GitCommandError, InvalidGitRepositoryError
 from parameterized import parameterized
 
 from config import InvalidVaultError
-from sb import app, info, sync
+from sb import _changed_files, _count_md, app, info, sync
+
+
+def make_dir_entries(*names, is_dir=True):
+    """Build stand-in os.DirEntry objects with the given names.
+
+    The entries are plain namespaces rather than mocks since info only reads them.
+    """
+    return [
+        SimpleNamespace(name=name, path=f"/test/vault/{name}", is_dir=lambda follow_symlinks=True: is_dir)
+        for name in names
+    ]
+
+
+class FakePath:
+    """Minimal stand-in for a vault directory, providing only what info uses.
+
+    Joined paths never exist, so folders outside the scandir listing are reported missing.
+    """
+
+    def __init__(self, path, is_dir=True):
+        self._path = path
+        self._is_dir = is_dir
+
+    def __str__(self):
+        return self._path
+
+    def __fspath__(self):
+        return self._path
+
+    def __truediv__(self, name):
+        return FakePath(f"{self._path}/{name}", is_dir=False)
+
+    def is_dir(self):
+        return self._is_dir
+
+
+# Configs are only read by the commands, so every test can share them
+SYNC_CONFIG = SimpleNamespace(vault_path=Path("/test/vault"), inbox_folder="0_Inbox")
+INFO_CONFIG = SimpleNamespace(vault_path=FakePath("/test/vault"), inbox_folder="0_Inbox")
 
 
 class TestSyncCommand(unittest.TestCase):
     """Unit tests for sync command."""
 
-    @patch("sb.load_config")
-    @patch("sb.git.Repo")
-    def test_sync_successful_flow(self, mock_repo_class, mock_load_config):
+    @classmethod
+    def setUpClass(cls):
+        """Patch the config loader and git.Repo once for the whole class."""
+        load_config_patcher = patch("sb.load_config")
+        cls.mock_load_config = load_config_patcher.start()
+        cls.addClassCleanup(load_config_patcher.stop)
+
+        repo_patcher = patch("git.Repo")
+        cls.mock_repo_class = repo_patcher.start()
+        cls.addClassCleanup(repo_patcher.stop)
+
+    def setUp(self):
+        """Reset the shared mocks for this test and capture the command output."""
+        self.mock_load_config.reset_mock(return_value=True, side_effect=True)
+        self.mock_repo_class.reset_mock(return_value=True, side_effect=True)
+        self.mock_load_config.return_value = SYNC_CONFIG
+
+        print_patcher = patch("sb.print")
+        self.mock_print = print_patcher.start()
+        self.addCleanup(print_patcher.stop)
+
+    def _make_repo_mocks(self, branch="master", status=""):
+        """Wire the patched git.Repo to a repository on `branch` whose porcelain status is `status`.
+
+        Returns:
+            tuple: The mock repository and its origin remote.
+        """
+        mock_repo = self.mock_repo_class.return_value
+        mock_repo.active_branch.name = branch
+        mock_repo.git.status.return_value = status
+        mock_repo.index.commit.return_value.hexsha = "abc1234"
+        return mock_repo, mock_repo.remote.return_value
+
+    def test_sync_successful_flow(self):
         """Test successful sync with changes to commit."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
-
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo.active_branch.name = "master"
-
-        mock_repo.is_dirty.return_value = True
-        mock_diff = Mock()
-        mock_diff.a_path = "modified_file.md"
-        mock_repo.index.diff.return_value = [mock_diff]
-        mock_repo.untracked_files = ["new_file.md"]
-
-        mock_commit = Mock()
-        mock_commit.hexsha = "abc1234"
-        mock_repo.index.commit.return_value = mock_commit
-
-        mock_origin = Mock()
-        mock_repo.remote.return_value = mock_origin
-
-        with patch("sb.print") as mock_print:
-            sync("master", "Test commit message", mock_config.vault_path)
-
-            mock_print.assert_any_call(
-                ":brain: Syncing Second Brain Vault at [green]/test/vault[/green] with remote repository branch [cyan]master[/cyan]..."
-            )
-            mock_print.assert_any_call("\n:package: Staging 2 file(s)...")
-            mock_print.assert_any_call(":white_check_mark: Committed 2 file(s)")
-
-    @patch("sb.load_config")
-    @patch("sb.git.Repo")
-    def test_sync_no_changes(self, mock_repo_class, mock_load_config):
-        """Test sync when there are no changes to commit."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
+        self._make_repo_mocks(status=" M modified_file.md\x00?? new_file.md\x00")
 
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo.active_branch.name = "master"
-        mock_repo.is_dirty.return_value = False
+        sync("master", "Test commit message", SYNC_CONFIG.vault_path)
 
-        mock_origin = Mock()
-        mock_repo.remote.return_value = mock_origin
+        self.mock_print.assert_any_call(
+            ":brain: Syncing Second Brain Vault at [green]/test/vault[/green] with remote repository branch [cyan]master[/cyan]..."
+        )
+        self.mock_print.assert_any_call("\n:package: Staging 2 file(s)...")
+        self.mock_print.assert_any_call(":white_check_mark: Committed 2 file(s)")
 
-        with patch("sb.print") as mock_print:
-            sync("master", "Test commit", mock_config.vault_path)
+    def test_sync_no_changes(self):
+        """Test sync when there are no changes to commit."""
+        self._make_repo_mocks()
 
-            mock_print.assert_any_call(":white_check_mark: No changes to commit.")
+        sync("master", "Test commit", SYNC_CONFIG.vault_path)
 
-    @patch("sb.load_config")
-    @patch("sb.git.Repo")
-    def test_sync_fetch_failure(self, mock_repo_class, mock_load_config):
-        """Test sync when fetch operation fails."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
+        self.mock_print.assert_any_call(":white_check_mark: No changes to commit.")
 
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo.active_branch.name = "master"
-        mock_repo.is_dirty.return_value = False
+    def test_sync_fetch_failure(self):
+        """Test sync when fetch operation fails."""
+        _, mock_origin = self._make_repo_mocks()
 
-        mock_origin = Mock()
         mock_origin.fetch.side_effect = Exception("Network error")
-        mock_repo.remote.return_value = mock_origin
 
-        with patch("sb.print") as mock_print:
-            with self.assertRaises(typer.Exit):
-                sync("master", "Test commit", mock_config.vault_path)
+        with self.assertRaises(typer.Exit):
+            sync("master", "Test commit", SYNC_CONFIG.vault_path)
 
-            mock_print.assert_any_call(":cross_mark: [bold red]Failed to fetch from remote: Network error[/bold red]")
+        self.mock_print.assert_any_call(":cross_mark: [bold red]Failed to fetch from remote: Network error[/bold red]")
 
-    @patch("sb.load_config")
-    @patch("sb.git.Repo")
-    def test_sync_rebase_failure(self, mock_repo_class, mock_load_config):
+    def test_sync_rebase_failure(self):
         """Test sync when rebase operation fails."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
-
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo.active_branch.name = "master"
-        mock_repo.is_dirty.return_value = False
-
-        mock_origin = Mock()
-        mock_repo.remote.return_value = mock_origin
+        mock_repo, _ = self._make_repo_mocks()
 
         # Mock rebase failure
         mock_repo.git.rebase.side_effect = GitCommandError("rebase", "Conflict detected")
 
-        with patch("sb.print") as mock_print:
-            with self.assertRaises(typer.Exit):
-                sync("master", "Test commit", mock_config.vault_path)
+        with self.assertRaises(typer.Exit):
+            sync("master", "Test commit", SYNC_CONFIG.vault_path)
 
-            mock_print.assert_any_call(
-                ":cross_mark: [bold red]Rebase failed: Cmd('rebase') failed due to: 'Conflict detected'\n  cmdline: rebase[/bold red]"
-            )
+        self.mock_print.assert_any_call(
+            ":cross_mark: [bold red]Rebase failed: Cmd('rebase') failed due to: 'Conflict detected'\n  cmdline: rebase[/bold red]"
+        )
 
-    @patch("sb.load_config")
-    @patch("sb.git.Repo")
-    def test_sync_push_failure(self, mock_repo_class, mock_load_config):
+    def test_sync_push_failure(self):
         """Test sync when push operation fails."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
-
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo.active_branch.name = "master"
-        mock_repo.is_dirty.return_value = False
-
-        mock_origin = Mock()
-        mock_repo.remote.return_value = mock_origin
+        _, mock_origin = self._make_repo_mocks()
 
         # Mock push failure
         mock_origin.push.side_effect = GitCommandError("push", "Permission denied")
 
-        with patch("sb.print") as mock_print:
-            with self.assertRaises(typer.Exit):
-                sync("master", "Test commit", mock_config.vault_path)
+        with self.assertRaises(typer.Exit):
+            sync("master", "Test commit", SYNC_CONFIG.vault_path)
 
-            mock_print.assert_any_call(
-                ":cross_mark: [bold red]Push failed: Cmd('push') failed due to: 'Permission denied'\n  cmdline: push[/bold red]"
-            )
+        self.mock_print.assert_any_call(
+            ":cross_mark: [bold red]Push failed: Cmd('push') failed due to: 'Permission denied'\n  cmdline: push[/bold red]"
+        )
 
-    @patch("sb.load_config")
-    def test_sync_invalid_git_repository(self, mock_load_config):
+    def test_sync_invalid_git_repository(self):
         """Test sync with invalid git repository."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/invalid/vault")
-        mock_load_config.return_value = mock_config
+        invalid_config = SimpleNamespace(vault_path=Path("/invalid/vault"))
+        self.mock_load_config.return_value = invalid_config
 
-        with patch("sb.git.Repo") as mock_repo_class:
-            mock_repo_class.side_effect = InvalidGitRepositoryError("Not a git repo")
+        self.mock_repo_class.side_effect = InvalidGitRepositoryError("Not a git repo")
 
-            with patch("sb.print") as mock_print:
-                with self.assertRaises(typer.Exit):
-                    sync("master", "Test commit", mock_config.vault_path)
+        with self.assertRaises(typer.Exit):
+            sync("master", "Test commit", invalid_config.vault_path)
 
-                mock_print.assert_any_call(
-                    ":cross_mark: [bold red]'/invalid/vault' is not a valid git repository.[/bold red]"
-                )
+        self.mock_print.assert_any_call(
+            ":cross_mark: [bold red]'/invalid/vault' is not a valid git repository.[/bold red]"
+        )
 
-    @patch("sb.load_config")
-    def test_sync_invalid_vault_error(self, mock_load_config):
+    def test_sync_invalid_vault_error(self):
         """Test sync when vault configuration is invalid."""
-        mock_load_config.side_effect = InvalidVaultError("Invalid vault path")
+        self.mock_load_config.side_effect = InvalidVaultError("Invalid vault path")
 
-        with patch("sb.print") as mock_print:
-            with self.assertRaises(typer.Exit):
-                sync("master", "Test commit", None)
+        with self.assertRaises(typer.Exit):
+            sync("master", "Test commit", None)
 
-            mock_print.assert_any_call(":cross_mark: [bold red]Invalid vault path[/bold red]")
+        self.mock_print.assert_any_call(":cross_mark: [bold red]Invalid vault path[/bold red]")
 
-    @patch("sb.load_config")
-    @patch("sb.git.Repo")
-    def test_sync_many_changed_files(self, mock_repo_class, mock_load_config):
+    def test_sync_many_changed_files(self):
         """Test sync with many changed files (more than 10)."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
-
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo.active_branch.name = "master"
-        mock_repo.is_dirty.return_value = True
-
         # Create 15 changed files
-        mock_diff_files = [Mock(a_path=f"file_{i}.md") for i in range(10)]
-        mock_repo.index.diff.return_value = mock_diff_files
-        mock_repo.untracked_files = [f"new_file_{i}.md" for i in range(5)]
-
-        mock_commit = Mock()
-        mock_commit.hexsha = "abc1234"
-        mock_repo.index.commit.return_value = mock_commit
-
-        mock_origin = Mock()
-        mock_repo.remote.return_value = mock_origin
+        modified = "".join(f" M file_{i}.md\x00" for i in range(10))
+        untracked = "".join(f"?? new_file_{i}.md\x00" for i in range(5))
+        self._make_repo_mocks(status=modified + untracked)
 
-        with patch("sb.print") as mock_print:
-            sync("master", "Test commit", mock_config.vault_path)
+        sync("master", "Test commit", SYNC_CONFIG.vault_path)
 
-            # Verify truncation message
-            mock_print.assert_any_call("   ... and 5 more")
+        # Verify truncation message
+        self.mock_print.assert_any_call("   ... and 5 more")
 
-    @patch("sb.load_config")
-    def test_sync_unexpected_error(self, mock_load_config):
+    def test_sync_unexpected_error(self):
         """Test sync with unexpected errors."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
+        self.mock_repo_class.side_effect = Exception("Unexpected disaster")
 
-        with patch("sb.git.Repo") as mock_repo_class:
-            mock_repo_class.side_effect = Exception("Unexpected disaster")
+        with self.assertRaises(typer.Exit):
+            sync("master", "Test commit", SYNC_CONFIG.vault_path)
 
-            with patch("sb.print") as mock_print:
-                with self.assertRaises(typer.Exit):
-                    sync("master", "Test commit", mock_config.vault_path)
+        self.mock_print.assert_any_call(":cross_mark: [bold red]Unexpected error: Unexpected disaster[/bold red]")
 
-                mock_print.assert_any_call(":cross_mark: [bold red]Unexpected error: Unexpected disaster[/bold red]")
+    @patch("sb.datetime")
+    def test_sync_default_message_uses_sync_time(self, mock_datetime):
+        """Test that the default commit message is timestamped when sync runs."""
+        mock_datetime.now.return_value = datetime(2024, 1, 15, 9, 30, 5)
 
-    @patch("sb.load_config")
-    @patch("sb.git.Repo")
-    def test_sync_only_untracked_files(self, mock_repo_class, mock_load_config):
-        """Test sync with only untracked files (no modified files)."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
+        mock_repo, _ = self._make_repo_mocks(status="?? note.md\x00")
 
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo.active_branch.name = "main"
-        mock_repo.is_dirty.return_value = True
+        sync("master", vault_path=SYNC_CONFIG.vault_path)
 
-        # Only untracked files, no modified files
-        mock_repo.index.diff.return_value = []
-        mock_repo.untracked_files = ["file1.md", "file2.md"]
+        mock_repo.index.commit.assert_called_once_with("vault backup: 2024-01-15 09:30:05")
 
-        mock_commit = Mock()
-        mock_commit.hexsha = "abc1234"
-        mock_repo.index.commit.return_value = mock_commit
+    def test_sync_only_untracked_files(self):
+        """Test sync with only untracked files (no modified files)."""
+        # Only untracked files, no modified files
+        self._make_repo_mocks(branch="main", status="?? file1.md\x00?? file2.md\x00")
 
-        mock_origin = Mock()
-        mock_repo.remote.return_value = mock_origin
+        sync("main", "Test commit", SYNC_CONFIG.vault_path)
 
-        with patch("sb.print") as mock_print:
-            sync("main", "Test commit", mock_config.vault_path)
+        # Verify both files were counted
+        self.mock_print.assert_any_call("\n:package: Staging 2 file(s)...")
 
-            # Verify both files were counted
-            mock_print.assert_any_call("\n:package: Staging 2 file(s)...")
+    def test_sync_counts_staged_and_renamed_files(self):
+        """Test sync lists staged files and renames once under their new path."""
+        self._make_repo_mocks(status="R  renamed.md\x00original.md\x00A  staged.md\x00")
 
-    @patch("sb.load_config")
-    @patch("sb.git.Repo")
-    def test_sync_rebase_abort_failure(self, mock_repo_class, mock_load_config):
-        """Test sync when rebase abort also fails."""
-        mock_config = Mock()
-        mock_config.vault_path = Path("/test/vault")
-        mock_load_config.return_value = mock_config
+        sync("master", "Test commit", SYNC_CONFIG.vault_path)
 
-        mock_repo = Mock()
-        mock_repo_class.return_value = mock_repo
-        mock_repo.active_branch.name = "main"
-        mock_repo.is_dirty.return_value = False
+        self.mock_print.assert_any_call("\n:package: Staging 2 file(s)...")
+        self.mock_print.assert_any_call("   - renamed.md")
+        self.mock_print.assert_any_call("   - staged.md")
 
-        mock_origin = Mock()
-        mock_repo.remote.return_value = mock_origin
+    def test_sync_rebase_abort_failure(self):
+        """Test sync when rebase abort also fails."""
+        mock_repo, _ = self._make_repo_mocks(branch="main")
 
         # Mock rebase failure
         mock_repo.git.rebase.side_effect = GitCommandError("rebase", "Conflict")
@@ -280,183 +239,150 @@ class TestSyncCommand(unittest.TestCase):
             GitCommandError("rebase --abort", "Abort failed"),
         ]
 
-        with patch("sb.print") as mock_print:
-            with self.assertRaises(typer.Exit):
-                sync("main", "Test commit", mock_config.vault_path)
+        with self.assertRaises(typer.Exit):
+            sync("main", "Test commit", SYNC_CONFIG.vault_path)
 
-            # Verify abort failure message
-            mock_print.assert_any_call(
-                "\t:warning: [yellow]Failed to abort rebase. Manual intervention may be needed.[/yellow]"
-            )
+        # Verify abort failure message
+        self.mock_print.assert_any_call(
+            "\t:warning: [yellow]Failed to abort rebase. Manual intervention may be needed.[/yellow]"
+        )
 
 
 class TestInfoCommand(unittest.TestCase):
     """Unit tests for info command."""
 
-    @patch("sb.load_config")
-    def test_info_successful(self, mock_load_config):
-        """Test successful info command execution."""
-        mock_config = Mock()
-        mock_vault_path = MagicMock(spec=Path)
-        mock_config.vault_path = mock_vault_path
-        mock_config.inbox_folder = "0_Inbox"
-        mock_load_config.return_value = mock_config
+    def setUp(self):
+        """Serve the shared config to info and capture the command output."""
+        load_config_patcher = patch("sb.load_config", return_value=INFO_CONFIG)
+        self.mock_load_config = load_config_patcher.start()
+        self.addCleanup(load_config_patcher.stop)
 
-        # Create mock inbox path
-        mock_inbox_path = MagicMock(spec=Path)
-        mock_inbox_path.exists.return_value = True
-        mock_inbox_path.is_dir.return_value = True
-        mock_inbox_path.glob.return_value = [Mock() for _ in range(2)]  # 2 files in inbox
+        print_patcher = patch("sb.print")
+        self.mock_print = print_patcher.start()
+        self.addCleanup(print_patcher.stop)
 
-        # Mock vault_path / inbox_folder to return mock_inbox_path
-        mock_vault_path.__truediv__.return_value = mock_inbox_path
-        mock_vault_path.exists.return_value = True
-        mock_vault_path.is_dir.return_value = True
-
-        # Mock glob for other folders (if needed by info command)
-        mock_vault_path.glob.return_value = [Mock() for _ in range(3)]
+    @patch("sb.os.scandir")
+    @patch("sb._count_md", return_value=(0, 0))
+    def test_info_successful(self, mock_count_md, mock_scandir):
+        """Test successful info command execution."""
+        mock_scandir.return_value.__enter__.return_value = make_dir_entries(
+            "0_Inbox", "1_Projects", "2_Areas", "3_Resources", "4_Archive"
+        )
 
-        with patch("sb.print") as mock_print:
-            info(vault_path=mock_config.vault_path)
+        info(vault_path=INFO_CONFIG.vault_path)
 
         # Verify basic info was printed
-        mock_print.assert_any_call("\n:open_file_folder: Folder Structure:")
+        self.mock_print.assert_any_call("\n:open_file_folder: Folder Structure:")
+        self.mock_print.assert_any_call("\t:white_check_mark: [green]4_Archive[/green] (0 notes)")
+        mock_scandir.assert_called_once_with(INFO_CONFIG.vault_path)
 
-    @patch("sb.load_config")
-    def test_info_missing_folders(self, mock_load_config):
+    @patch("sb.os.scandir")
+    @patch("sb._count_md", return_value=(0, 0))
+    def test_info_missing_folders(self, mock_count_md, mock_scandir):
         """Test info command with missing folders."""
-        mock_config = Mock()
-        mock_vault_path = MagicMock(spec=Path)
-        mock_vault_path.__str__.return_value = "/test/vault"
-        mock_config.vault_path = mock_vault_path
-        mock_config.inbox_folder = "0_Inbox"
-        mock_load_config.return_value = mock_config
-
-        # Create mocks for different folder paths
-        mock_inbox = MagicMock(spec=Path)
-        mock_inbox.exists.return_value = True
-        mock_inbox.is_dir.return_value = True
-        mock_inbox.glob.return_value = []
-
-        mock_projects = MagicMock(spec=Path)
-        mock_projects.exists.return_value = True
-        mock_projects.is_dir.return_value = True
-        mock_projects.glob.return_value = []
-
-        mock_areas = MagicMock(spec=Path)
-        mock_areas.exists.return_value = False  # This folder is missing
-
-        # Map folder names to their mocks
-        folder_mocks = {
-            "0_Inbox": mock_inbox,
-            "1_Projects": mock_projects,
-            "2_Areas": mock_areas,
-        }
+        # 2_Areas is absent from the vault listing, 3_Resources is a file
+        mock_scandir.return_value.__enter__.return_value = make_dir_entries("0_Inbox", "1_Projects") + make_dir_entries(
+            "3_Resources", is_dir=False
+        )
 
-        def truediv_side_effect(folder_name):
-            return folder_mocks.get(folder_name, MagicMock(spec=Path))
-
-        mock_vault_path.__truediv__.side_effect = truediv_side_effect
-
-        with patch("sb.print") as mock_print:
-            info(vault_path=mock_config.vault_path)
+        info(vault_path=INFO_CONFIG.vault_path)
 
         # Verify missing folders are reported
-        mock_print.assert_any_call("\t:cross_mark: [red]2_Areas (missing)[/red]")
+        self.mock_print.assert_any_call("\t:white_check_mark: [green]1_Projects[/green] (0 notes)")
+        self.mock_print.assert_any_call("\t:cross_mark: [red]2_Areas (missing)[/red]")
+        self.mock_print.assert_any_call("\t:cross_mark: [red]3_Resources (missing)[/red]")
 
-    @patch("sb.load_config")
-    def test_info_empty_inbox(self, mock_load_config):
+    @patch("sb.os.scandir")
+    @patch("sb._count_md", return_value=(0, 0))
+    def test_info_empty_inbox(self, mock_count_md, mock_scandir):
         """Test info command with empty inbox."""
-        mock_config = Mock()
-        mock_vault_path = MagicMock(spec=Path)
-        mock_config.vault_path = mock_vault_path
-        mock_config.inbox_folder = "0_Inbox"
-        mock_load_config.return_value = mock_config
-
-        # Create mock inbox path
-        mock_inbox_path = MagicMock(spec=Path)
-        mock_inbox_path.exists.return_value = True
-        mock_inbox_path.is_dir.return_value = True
-        mock_inbox_path.glob.return_value = []  # No files in inbox
-
-        # Mock vault_path / inbox_folder to return mock_inbox_path
-        mock_vault_path.__truediv__.return_value = mock_inbox_path
-        mock_vault_path.exists.return_value = True
-        mock_vault_path.is_dir.return_value = True
-
-        with patch("sb.print") as mock_print:
-            info(vault_path=mock_config.vault_path)
+        mock_scandir.return_value.__enter__.return_value = make_dir_entries("0_Inbox")
+
+        info(vault_path=INFO_CONFIG.vault_path)
 
         # Verify empty inbox message
-        mock_print.assert_any_call("\n:inbox_tray: Inbox is empty :sparkles:")
+        self.mock_print.assert_any_call("\n:inbox_tray: Inbox is empty :sparkles:")
 
-    @patch("sb.load_config")
-    def test_info_many_inbox_files(self, mock_load_config):
+    @patch("sb.os.scandir")
+    @patch("sb._count_md", return_value=(8, 8))
+    def test_info_many_inbox_files(self, mock_count_md, mock_scandir):
         """Test info command with many inbox files (triggering review suggestion)."""
-        mock_config = Mock()
-        mock_vault_path = MagicMock(spec=Path)
-        mock_config.vault_path = mock_vault_path
-        mock_config.inbox_folder = "0_Inbox"
-        mock_load_config.return_value = mock_config
-
-        # Create mock inbox path
-        mock_inbox_path = MagicMock(spec=Path)
-        mock_inbox_path.exists.return_value = True
-        mock_inbox_path.is_dir.return_value = True
-        mock_inbox_path.glob.return_value = [Mock() for _ in range(8)]  # Many files in inbox
-
-        # Mock vault_path / inbox_folder to return mock_inbox_path
-        mock_vault_path.__truediv__.return_value = mock_inbox_path
-        mock_vault_path.exists.return_value = True
-        mock_vault_path.is_dir.return_value = True
-
-        with patch("sb.print") as mock_print:
-            info(vault_path=mock_config.vault_path)
+        mock_scandir.return_value.__enter__.return_value = make_dir_entries("0_Inbox")
+
+        info(vault_path=INFO_CONFIG.vault_path)
 
         # Verify review suggestion
-        mock_print.assert_any_call("\t:light_bulb: [yellow]Consider doing a weekly review![/yellow]")
+        self.mock_print.assert_any_call("\t:light_bulb: [yellow]Consider doing a weekly review![/yellow]")
 
-    @patch("sb.load_config")
-    def test_info_missing_inbox_folder(self, mock_load_config):
+    @patch("sb.os.scandir")
+    def test_info_missing_inbox_folder(self, mock_scandir):
         """Test info command when inbox folder is missing."""
-        mock_config = Mock()
-        mock_vault_path = MagicMock(spec=Path)
-        mock_config.vault_path = mock_vault_path
-        mock_config.inbox_folder = "0_Inbox"
-        mock_load_config.return_value = mock_config
-
-        # Create mock inbox path
-        mock_inbox_path = MagicMock(spec=Path)
-        mock_inbox_path.exists.return_value = False
-        mock_inbox_path.is_dir.return_value = True
-        mock_inbox_path.glob.return_value = [Mock() for _ in range(8)]  # Many files in inbox
-
-        # Mock vault_path / inbox_folder to return mock_inbox_path
-        mock_vault_path.__truediv__.return_value = mock_inbox_path
-        mock_vault_path.exists.return_value = True
-        mock_vault_path.is_dir.return_value = True
-
-        with patch("sb.print") as mock_print:
-            info(vault_path=mock_config.vault_path)
+        mock_scandir.return_value.__enter__.return_value = []
+
+        info(vault_path=INFO_CONFIG.vault_path)
 
         # Verify missing inbox message
-        mock_print.assert_any_call("\n:cross_mark: [red]0_Inbox folder is missing![/red]")
+        self.mock_print.assert_any_call("\n:cross_mark: [red]0_Inbox folder is missing![/red]")
 
-    @patch("sb.load_config")
-    def test_info_invalid_vault_error(self, mock_load_config):
+    def test_info_invalid_vault_error(self):
         """Test info command when vault configuration is invalid."""
-        mock_load_config.side_effect = InvalidVaultError("Invalid vault configuration")
+        self.mock_load_config.side_effect = InvalidVaultError("Invalid vault configuration")
+
+        with self.assertRaises(typer.Exit):
+            info(vault_path=None)
 
-        with patch("sb.print") as mock_print:
-            with self.assertRaises(typer.Exit):
-                info(vault_path=None)
+        self.mock_print.assert_any_call(":cross_mark: [bold red]Invalid vault configuration[/bold red]")
 
-        mock_print.assert_any_call(":cross_mark: [bold red]Invalid vault configuration[/bold red]")
+
+class TestChangedFiles(unittest.TestCase):
+    """Unit tests for parsing `git status --porcelain=v1 -z` output."""
+
+    @parameterized.expand(
+        [
+            ("empty", "", []),
+            ("modified_and_untracked", " M modified.md\x00?? new.md\x00", ["modified.md", "new.md"]),
+            ("staged_rename", "R  new.md\x00old.md\x00", ["new.md"]),
+            ("staged_copy", "C  copy.md\x00original.md\x00", ["copy.md"]),
+            ("worktree_rename", " R new.md\x00old.md\x00", ["new.md"]),
+            ("rename_then_added", "R  new.md\x00old.md\x00A  staged.md\x00", ["new.md", "staged.md"]),
+        ]
+    )
+    def test_changed_files(self, _name, status, expected):
+        """Test that each changed path is listed once, under its new name for renames and copies."""
+        self.assertEqual(_changed_files(status), expected)
+
+
+class TestCountMd(unittest.TestCase):
+    """Unit tests for the markdown note counter used by info."""
+
+    @patch("sb.os.scandir")
+    def test_count_md_skips_unreadable_directories(self, mock_scandir):
+        """Test that a subdirectory that cannot be read is skipped instead of aborting the count."""
+        tree = {
+            "/test/vault": make_dir_entries("note.md", is_dir=False) + make_dir_entries("readable", "locked"),
+            "/test/vault/readable": make_dir_entries("nested.md", is_dir=False),
+        }
+
+        def fake_scandir(path):
+            if path not in tree:
+                raise PermissionError(13, "Permission denied", path)
+            return nullcontext(tree[path])
+
+        mock_scandir.side_effect = fake_scandir
+
+        self.assertEqual(_count_md("/test/vault"), (2, 1))
+        mock_scandir.assert_any_call("/test/vault/locked")
 
 
 class TestAppConfiguration(unittest.TestCase):
     """Tests for Typer app configuration."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Collect the registered command and group names once for the whole class."""
+        cls.command_names = frozenset(cmd.name for cmd in app.registered_commands)
+        cls.group_names = frozenset(grp.name for grp in app.registered_groups)
+
     def test_app_initialization(self):
         """Test that the Typer app is properly configured."""
         self.assertEqual(app.info.name, "sb")
@@ -471,7 +397,7 @@ class TestAppConfiguration(unittest.TestCase):
     )
     def test_app_has_commands(self, command_name):
         """Test that the app has the expected commands."""
-        self.assertIn(command_name, [cmd.name for cmd in app.registered_commands])
+        self.assertIn(command_name, self.command_names)
 
     @parameterized.expand(
         [
@@ -480,4 +406,4 @@ class TestAppConfiguration(unittest.TestCase):
     )
     def test_app_has_subcommands(self, command_name):
         """Test that the app has the expected subcommands."""
-        self.assertIn(command_name, [grp.name for grp in app.registered_groups])
+        self.assertIn(command_name, self.group_names)
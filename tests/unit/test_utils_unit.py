@@ -5,10 +5,12 @@ Mock all external dependencies to test functions in isolation.
 
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import patch
+
+from parameterized import parameterized
 
 # Import the functions to test
-from utils import daily_exists, find_vault_root, format_hashtags, sanitize_filename
+from utils import _find_vault_root_from, daily_exists, find_vault_root, format_hashtags, sanitize_filename
 
 
 class TestDailyExists(unittest.TestCase):
@@ -16,130 +18,103 @@ class TestDailyExists(unittest.TestCase):
 
     def setUp(self):
         """Set up any necessary test data."""
-        self.mock_path = Mock(spec=Path)
-        self.mock_path.exists.return_value = True
-
-    def test_daily_exists_returns_true_when_path_exists(self):
-        """Test that daily_exists returns True when path exists."""
-        result = daily_exists(self.mock_path)
-
-        self.assertTrue(result)
-        self.mock_path.exists.assert_called_once()
+        self.daily_path = Path("/vault/2_Areas/Journal/Daily/2024-01-15.md")
 
-    def test_daily_exists_returns_false_when_path_does_not_exist(self):
-        """Test that daily_exists returns False when path doesn't exist."""
-        self.mock_path.exists.return_value = False
+    @parameterized.expand(
+        [
+            ("path_exists", True),
+            ("path_does_not_exist", False),
+        ]
+    )
+    @patch("utils.os.path.exists")
+    def test_daily_exists_reports_path_existence(self, _name, exists, mock_exists):
+        """Test that daily_exists returns whether the daily note path exists."""
+        mock_exists.return_value = exists
 
-        result = daily_exists(self.mock_path)
+        result = daily_exists(self.daily_path)
 
-        self.assertFalse(result)
-        self.mock_path.exists.assert_called_once()
+        self.assertIs(result, exists)
+        mock_exists.assert_called_once_with(self.daily_path)
 
     def test_daily_exists_with_none_path(self):
         """Test daily_exists with None path."""
-        with self.assertRaises(AttributeError):
+        with self.assertRaises(TypeError):
             daily_exists(None)
 
 
 class TestFindVaultRoot(unittest.TestCase):
     """Unit tests for find_vault_root function."""
 
-    @patch("utils.Path.cwd")
-    def test_find_vault_root_found_in_parent_directory(self, mock_cwd):
-        """Test finding vault in parent directory."""
-        # Mock current directory structure
-        mock_current = MagicMock(spec=Path)
-        mock_parent = MagicMock(spec=Path)
-        mock_grandparent = MagicMock(spec=Path)
-
-        mock_current.parent = mock_parent
-        mock_parent.parent = mock_grandparent
-        mock_grandparent.parent = mock_grandparent  # Root condition
-
-        mock_cwd.return_value = mock_current
-
-        # Mock vault NOT found in current directory
-        mock_current_path = MagicMock(spec=Path)
-        mock_current_path.exists.return_value = False
-        mock_current.__truediv__.return_value = mock_current_path
+    def setUp(self):
+        """Start each test with an empty vault root cache."""
+        _find_vault_root_from.cache_clear()
 
-        # Mock vault found in parent directory
-        mock_vault_path = MagicMock(spec=Path)
-        mock_vault_path.exists.return_value = True
-        mock_vault_path.is_dir.return_value = True
+    @patch("utils.os.path.isdir")
+    @patch("utils.os.getcwd")
+    def test_find_vault_root_found_in_parent_directory(self, mock_getcwd, mock_isdir):
+        """Test finding vault in parent directory."""
+        mock_getcwd.return_value = "/home/user/projects"
 
-        mock_parent.__truediv__.return_value = mock_vault_path
+        # Mock vault found only next to the parent directory
+        mock_isdir.side_effect = lambda path: path == "/home/user/test_vault"
 
         result = find_vault_root("test_vault")
 
-        self.assertEqual(result, mock_vault_path)
-        mock_parent.__truediv__.assert_called_with("test_vault")
+        self.assertEqual(result, Path("/home/user/test_vault"))
+        mock_isdir.assert_called_with("/home/user/test_vault")
 
-    @patch("utils.Path.cwd")
-    def test_find_vault_root_not_found(self, mock_cwd):
+    @patch("utils.os.path.isdir")
+    @patch("utils.os.getcwd")
+    def test_find_vault_root_not_found(self, mock_getcwd, mock_isdir):
         """Test when vault is not found in directory tree."""
-        mock_current = MagicMock(spec=Path)
-        mock_parent = MagicMock(spec=Path)
-        mock_current.parent = mock_parent
-        mock_parent.parent = mock_parent  # Root condition
-        mock_cwd.return_value = mock_current
-
-        # Mock vault not found in current directory
-        mock_current_vault_path = MagicMock(spec=Path)
-        mock_current_vault_path.exists.return_value = False
-        mock_current.__truediv__.return_value = mock_current_vault_path
-
-        # Mock vault not found in parent directory (root)
-        mock_parent_vault_path = MagicMock(spec=Path)
-        mock_parent_vault_path.exists.return_value = False
-        mock_parent.__truediv__.return_value = mock_parent_vault_path
+        mock_getcwd.return_value = "/home/user"
+        mock_isdir.return_value = False
 
         result = find_vault_root("nonexistent_vault")
 
         self.assertIsNone(result)
+        self.assertEqual(mock_isdir.call_count, 2)
 
-    @patch("utils.Path.cwd")
-    def test_find_vault_root_found_when_already_inside_vault(self, mock_cwd):
+    @patch("utils.os.path.isdir")
+    @patch("utils.os.getcwd")
+    def test_find_vault_root_found_when_already_inside_vault(self, mock_getcwd, mock_isdir):
         """Test finding vault when already inside it."""
-        # Create a chain of mock directories
-        mock_vault_dir = MagicMock(spec=Path)
-        mock_vault_dir.name = "my_vault"
-        mock_vault_dir.parent = MagicMock(spec=Path)
-        mock_vault_dir.parent.parent = mock_vault_dir.parent  # Root condition
-
-        mock_subdir = MagicMock(spec=Path)
-        mock_subdir.name = "subfolder"
-        mock_subdir.parent = mock_vault_dir
-
-        mock_subdir_vault_path = MagicMock(spec=Path)
-        mock_subdir_vault_path.exists.return_value = False
-        mock_subdir.__truediv__.return_value = mock_subdir_vault_path
-
-        mock_vault_child_path = MagicMock(spec=Path)
-        mock_vault_child_path.exists.return_value = False
-        mock_vault_dir.__truediv__.return_value = mock_vault_child_path
-
-        mock_cwd.return_value = mock_subdir
+        mock_getcwd.return_value = "/home/my_vault/subfolder"
+        mock_isdir.return_value = False
 
         result = find_vault_root("my_vault")
 
-        self.assertEqual(result, mock_vault_dir)
+        self.assertEqual(result, Path("/home/my_vault"))
 
-    @patch("utils.Path.cwd")
-    def test_find_vault_root_not_found_when_not_inside_vault(self, mock_cwd):
+    @patch("utils.os.path.isdir")
+    @patch("utils.os.getcwd")
+    def test_find_vault_root_not_found_when_not_inside_vault(self, mock_getcwd, mock_isdir):
         """Test not finding vault when not inside it."""
-        mock_current = Mock(spec=Path)
-        mock_current.name = "some_other_folder"
-        mock_current.parent = mock_current  # Root condition
-
-        mock_cwd.return_value = mock_current
+        mock_getcwd.return_value = "/"
 
         result = find_vault_root("target_vault")
 
         self.assertIsNone(result)
+        mock_isdir.assert_not_called()
+
+    @patch("utils.os.path.isdir")
+    @patch("utils.os.getcwd")
+    def test_find_vault_root_is_cached_per_cwd(self, mock_getcwd, mock_isdir):
+        """Test that repeated lookups from the same directory do not walk the tree again."""
+        mock_getcwd.return_value = "/home/my_vault/subfolder"
+        mock_isdir.return_value = False
+
+        first = find_vault_root("my_vault")
+        second = find_vault_root("my_vault")
+
+        self.assertEqual(first, second)
+        mock_isdir.assert_called_once_with("/home/my_vault/subfolder/my_vault")
 
-    @patch("utils.Path.cwd")
-    def test_find_vault_root_empty_vault_name(self, mock_cwd):
+        mock_getcwd.return_value = "/home/other"
+        self.assertIsNone(find_vault_root("my_vault"))
+
+    @patch("utils.os.getcwd")
+    def test_find_vault_root_empty_vault_name(self, mock_getcwd):
         """Test find_vault_root with empty vault name."""
         vault_name = ""
 
@@ -147,91 +122,30 @@ class TestFindVaultRoot(unittest.TestCase):
 
         # Should return None since empty name won't match any directory
         self.assertIsNone(result)
+        mock_getcwd.assert_not_called()
 
 
 class TestSanitizeFilename(unittest.TestCase):
     """Unit tests for sanitize_filename function."""
 
-    def test_sanitize_filename_basic_case(self):
-        """Test basic filename sanitization."""
-        title = "My Test File"
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "my_test_file")
-
-    def test_sanitize_filename_with_special_characters(self):
-        """Test sanitization with special characters."""
-        title = "File@Name#With$Special%Characters&"
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "filenamewithspecialcharacters")
-
-    def test_sanitize_filename_with_multiple_spaces(self):
-        """Test sanitization with multiple spaces."""
-        title = "File   With    Multiple     Spaces"
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "file_with_multiple_spaces")
-
-    def test_sanitize_filename_with_hyphens_and_underscores(self):
-        """Test sanitization preserving hyphens and normalizing underscores."""
-        title = "File-With--Multiple___Underscores---"
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "file-with-multiple_underscores")
-
-    def test_sanitize_filename_with_leading_trailing_special_chars(self):
-        """Test sanitization removing leading/trailing special characters."""
-        title = "---__Test File__---"
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "test_file")
-
-    def test_sanitize_filename_empty_string(self):
-        """Test sanitization with empty string."""
-        title = ""
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "untitled")
-
-    def test_sanitize_filename_only_special_characters(self):
-        """Test sanitization with only special characters."""
-        title = "@#$%^&*()"
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "untitled")
-
-    def test_sanitize_filename_with_numbers(self):
-        """Test sanitization with numbers."""
-        title = "File 123 with Numbers 456"
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "file_123_with_numbers_456")
-
-    def test_sanitize_filename_whitespace_only(self):
-        """Test sanitization with whitespace only."""
-        title = "   \t\n  "
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "untitled")
-
-    def test_sanitize_filename_mixed_case(self):
-        """Test that output is always lowercase."""
-        title = "MixedCase FILE Name"
-
-        result = sanitize_filename(title)
-
-        self.assertEqual(result, "mixedcase_file_name")
-        self.assertTrue(result.islower())
+    @parameterized.expand(
+        [
+            ("basic_case", "My Test File", "my_test_file"),
+            ("special_characters", "File@Name#With$Special%Characters&", "filenamewithspecialcharacters"),
+            ("multiple_spaces", "File   With    Multiple     Spaces", "file_with_multiple_spaces"),
+            ("hyphens_and_underscores", "File-With--Multiple___Underscores---", "file-with-multiple_underscores"),
+            ("leading_trailing_special_chars", "---__Test File__---", "test_file"),
+            ("empty_string", "", "untitled"),
+            ("only_special_characters", "@#$%^&*()", "untitled"),
+            ("numbers", "File 123 with Numbers 456", "file_123_with_numbers_456"),
+            ("whitespace_only", "   \t\n  ", "untitled"),
+            ("mixed_case", "MixedCase FILE Name", "mixedcase_file_name"),
+            ("non_ascii_characters", "Café Notes – Über €100", "caf_notes_ber_100"),
+        ]
+    )
+    def test_sanitize_filename(self, _name, title, expected):
+        """Test that titles are sanitized into lowercase, filesystem-safe names."""
+        self.assertEqual(sanitize_filename(title), expected)
 
     def test_sanitize_filename_none_input(self):
         """Test sanitize_filename with None input."""
@@ -242,69 +156,31 @@ class TestSanitizeFilename(unittest.TestCase):
 class TestFormatHashtags(unittest.TestCase):
     """Unit tests for format_hashtags function."""
 
-    def test_format_hashtags_normal_case(self):
-        """Test formatting normal comma-separated hashtags."""
-        hashtags = "python, testing, automation"
-
-        result = format_hashtags(hashtags)
-
-        self.assertEqual(result, "#python #testing #automation")
-
-    def test_format_hashtags_empty_string(self):
-        """Test formatting with empty string."""
-        hashtags = ""
-
-        result = format_hashtags(hashtags)
-
-        self.assertEqual(result, "")
-
-    def test_format_hashtags_none_input(self):
-        """Test formatting with None input."""
-        hashtags = None
-
-        result = format_hashtags(hashtags)
-
-        self.assertEqual(result, "")
-
-    def test_format_hashtags_with_extra_spaces(self):
-        """Test formatting with extra spaces around commas."""
-        hashtags = "  python , testing  ,automation  "
-
-        result = format_hashtags(hashtags)
-
-        self.assertEqual(result, "#python #testing #automation")
-
-    def test_format_hashtags_single_tag(self):
-        """Test formatting with single hashtag."""
-        hashtags = "python"
-
-        result = format_hashtags(hashtags)
-
-        self.assertEqual(result, "#python")
-
-    def test_format_hashtags_empty_tags(self):
-        """Test formatting with empty tags in the list."""
-        hashtags = "python,,testing,,automation"
-
-        result = format_hashtags(hashtags)
-
-        self.assertEqual(result, "#python #testing #automation")
-
-    def test_format_hashtags_all_empty_tags(self):
-        """Test formatting with all empty tags."""
-        hashtags = ",,, ,,"
-
-        result = format_hashtags(hashtags)
-
-        self.assertEqual(result, "")
-
-    def test_format_hashtags_with_special_characters(self):
-        """Test formatting with special characters in tags."""
-        hashtags = "python-3, unit_test, api_v2"
-
-        result = format_hashtags(hashtags)
-
-        self.assertEqual(result, "#python-3 #unit_test #api_v2")
+    @parameterized.expand(
+        [
+            ("normal_case", "python, testing, automation", "#python #testing #automation"),
+            ("empty_string", "", ""),
+            ("none_input", None, ""),
+            ("extra_spaces", "  python , testing  ,automation  ", "#python #testing #automation"),
+            ("single_tag", "python", "#python"),
+            ("empty_tags", "python,,testing,,automation", "#python #testing #automation"),
+            ("all_empty_tags", ",,, ,,", ""),
+            ("special_characters", "python-3, unit_test, api_v2", "#python-3 #unit_test #api_v2"),
+        ]
+    )
+    def test_format_hashtags(self, _name, hashtags, expected):
+        """Test formatting comma-separated tags as space-separated hashtags."""
+        self.assertEqual(format_hashtags(hashtags), expected)
+
+    def test_format_hashtags_is_cached(self):
+        """Test that repeated tag strings are served from the cache."""
+        format_hashtags.cache_clear()
+
+        first = format_hashtags("python, testing")
+        second = format_hashtags("python, testing")
+
+        self.assertEqual(first, second)
+        self.assertEqual(format_hashtags.cache_info().hits, 1)
 
     def test_format_hashtags_with_integer_input(self):
         """Test format_hashtags with integer input."""